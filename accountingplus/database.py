@@ -16,12 +16,13 @@ def load_database_config(base_dir: Path) -> Dict[str, Dict[str, Any]]:
     DJANGO_DB_HOST, DJANGO_DB_PORT.
     """
 
-    engine = os.environ.get("DJANGO_DB_ENGINE", "django.db.backends.sqlite3")
+    env = os.environ.get
+    engine = env("DJANGO_DB_ENGINE", "django.db.backends.sqlite3")
 
     if engine == "django.db.backends.sqlite3":
-        name: Any = os.environ.get("DJANGO_DB_NAME", base_dir / "db.sqlite3")
+        name: Any = env("DJANGO_DB_NAME", base_dir / "db.sqlite3")
     else:
-        name = os.environ.get("DJANGO_DB_NAME")
+        name = env("DJANGO_DB_NAME")
         if not name:
             raise ValueError(
                 "Environment variable DJANGO_DB_NAME is required for non-SQLite databases."
@@ -31,10 +32,10 @@ def load_database_config(base_dir: Path) -> Dict[str, Dict[str, Any]]:
         "default": {
             "ENGINE": engine,
             "NAME": name,
-            "USER": os.environ.get("DJANGO_DB_USER", ""),
-            "PASSWORD": os.environ.get("DJANGO_DB_PASSWORD", ""),
-            "HOST": os.environ.get("DJANGO_DB_HOST", ""),
-            "PORT": os.environ.get("DJANGO_DB_PORT", ""),
+            "USER": env("DJANGO_DB_USER", ""),
+            "PASSWORD": env("DJANGO_DB_PASSWORD", ""),
+            "HOST": env("DJANGO_DB_HOST", ""),
+            "PORT": env("DJANGO_DB_PORT", ""),
         }
     }
 
@@ -9,12 +9,14 @@ from .database import load_database_config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "django-insecure-accountingplus")
+_env = os.environ.get
 
-DEBUG = os.environ.get("DJANGO_DEBUG", "1") == "1"
+SECRET_KEY = _env("DJANGO_SECRET_KEY", "django-insecure-accountingplus")
+
+DEBUG = _env("DJANGO_DEBUG", "1") == "1"
 
 ALLOWED_HOSTS: List[str] = [
-    host for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",") if host
+    host for host in _env("DJANGO_ALLOWED_HOSTS", "").split(",") if host
 ]
 
 INSTALLED_APPS = [
@@ -4,14 +4,22 @@ from __future__ import annotations
 from django.contrib import admin
 from django.urls import include, path
 from django.contrib.auth import views as auth_views
+from django.utils.module_loading import import_string
+
+
+class AccountingLoginView(auth_views.LoginView):
+    """Login view that resolves the styled authentication form on first use."""
+
+    authentication_form_path = "persons.forms.AccountingAuthenticationForm"
+
+    def get_form_class(self):
+        return self.authentication_form or import_string(self.authentication_form_path)
 
-from persons.forms import AccountingAuthenticationForm
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("accounts/login/", auth_views.LoginView.as_view(
+    path("accounts/login/", AccountingLoginView.as_view(
         template_name="auth/login.html",
-        authentication_form=AccountingAuthenticationForm,
         redirect_authenticated_user=True,
     ), name="login"),
     path("accounts/logout/", auth_views.LogoutView.as_view(), name="logout"),
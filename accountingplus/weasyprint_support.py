@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Tuple
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
 
+_IS_MACOS = sys.platform == "darwin"
 _HOME_BREW_CANDIDATES: Tuple[Path, ...] = (Path("/opt/homebrew"), Path("/usr/local"))
 
 
+@lru_cache(maxsize=1)
 def _existing_prefixes() -> Tuple[Path, ...]:
     """Return Homebrew prefixes that exist on the current machine."""
     prefixes = tuple(prefix for prefix in _HOME_BREW_CANDIDATES if prefix.exists())
@@ -20,65 +24,113 @@ def _prepend_env(name: str, value: str) -> None:
     if not value:
         return
     current = os.environ.get(name)
-    parts = current.split(":") if current else []
-    if value in parts:
+    if not current:
+        os.environ[name] = value
         return
-    os.environ[name] = ":".join([value] + parts) if parts else value
+    if f":{value}:" in f":{current}:":
+        return
+    os.environ[name] = f"{value}:{current}"
 
 
-def configure_environment(prefixes: Iterable[Path] | None = None) -> Tuple[Path, ...]:
-    """Expose Homebrew library/bin/pkgconfig paths via environment variables."""
-    resolved = tuple(prefixes) if prefixes is not None else _existing_prefixes()
-    for prefix in resolved:
+@lru_cache(maxsize=None)
+def _environment_edits(prefixes: Tuple[Path, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Return ``(variable, path)`` pairs for Homebrew directories present on disk."""
+    edits: list[Tuple[str, str]] = []
+    for prefix in prefixes:
         lib_dir = prefix / "lib"
         if lib_dir.exists():
             lib_path = str(lib_dir)
-            _prepend_env("DYLD_FALLBACK_LIBRARY_PATH", lib_path)
-            _prepend_env("DYLD_LIBRARY_PATH", lib_path)
-            _prepend_env("LIBRARY_PATH", lib_path)
-        pkgconfig_dir = prefix / "lib" / "pkgconfig"
+            edits.append(("DYLD_FALLBACK_LIBRARY_PATH", lib_path))
+            edits.append(("DYLD_LIBRARY_PATH", lib_path))
+            edits.append(("LIBRARY_PATH", lib_path))
+        pkgconfig_dir = lib_dir / "pkgconfig"
         if pkgconfig_dir.exists():
-            _prepend_env("PKG_CONFIG_PATH", str(pkgconfig_dir))
+            edits.append(("PKG_CONFIG_PATH", str(pkgconfig_dir)))
         bin_dir = prefix / "bin"
         if bin_dir.exists():
-            _prepend_env("PATH", str(bin_dir))
+            edits.append(("PATH", str(bin_dir)))
+    return tuple(edits)
+
+
+def configure_environment(prefixes: Iterable[Path] | None = None) -> Tuple[Path, ...]:
+    """Expose Homebrew library/bin/pkgconfig paths via environment variables."""
+    resolved = tuple(prefixes) if prefixes is not None else _existing_prefixes()
+    for name, value in _environment_edits(resolved):
+        _prepend_env(name, value)
     return resolved
 
 
-def _macos_library_candidates() -> dict[str, Tuple[str, ...]]:
+_GOBJECT_DYLIBS = ("libgobject-2.0.dylib", "libgobject-2.0.0.dylib")
+_PANGO_DYLIBS = ("libpango-1.0.dylib", "libpango-1.0.0.dylib")
+_HARFBUZZ_DYLIBS = ("libharfbuzz.dylib", "libharfbuzz.0.dylib")
+_HARFBUZZ_SUBSET_DYLIBS = ("libharfbuzz-subset.dylib", "libharfbuzz-subset.0.dylib")
+_FONTCONFIG_DYLIBS = ("libfontconfig.dylib", "libfontconfig.1.dylib")
+_PANGOFT2_DYLIBS = ("libpangoft2-1.0.dylib", "libpangoft2-1.0.0.dylib")
+_CAIRO_DYLIBS = ("libcairo.dylib", "libcairo.2.dylib")
+
+_MACOS_LIBRARY_CANDIDATES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "libgobject-2.0-0": _GOBJECT_DYLIBS,
+        "gobject-2.0-0": _GOBJECT_DYLIBS,
+        "gobject-2.0": _GOBJECT_DYLIBS,
+        "libpango-1.0-0": _PANGO_DYLIBS,
+        "pango-1.0-0": _PANGO_DYLIBS,
+        "pango-1.0": _PANGO_DYLIBS,
+        "libharfbuzz-0": _HARFBUZZ_DYLIBS,
+        "harfbuzz": _HARFBUZZ_DYLIBS,
+        "harfbuzz-0.0": _HARFBUZZ_DYLIBS,
+        "libharfbuzz-subset-0": _HARFBUZZ_SUBSET_DYLIBS,
+        "harfbuzz-subset": _HARFBUZZ_SUBSET_DYLIBS,
+        "harfbuzz-subset-0.0": _HARFBUZZ_SUBSET_DYLIBS,
+        "libfontconfig-1": _FONTCONFIG_DYLIBS,
+        "fontconfig-1": _FONTCONFIG_DYLIBS,
+        "fontconfig": _FONTCONFIG_DYLIBS,
+        "libpangoft2-1.0-0": _PANGOFT2_DYLIBS,
+        "pangoft2-1.0-0": _PANGOFT2_DYLIBS,
+        "pangoft2-1.0": _PANGOFT2_DYLIBS,
+        "libcairo": _CAIRO_DYLIBS,
+        "cairo": _CAIRO_DYLIBS,
+    }
+)
+
+
+def _macos_library_candidates() -> Mapping[str, Tuple[str, ...]]:
+    return _MACOS_LIBRARY_CANDIDATES
+
+
+def _existing_library_paths(lib_roots: Tuple[Path, ...], filenames: Iterable[str]) -> Tuple[str, ...]:
+    """Return absolute paths for ``filenames`` that exist under any of ``lib_roots``."""
+    paths = []
+    for filename in filenames:
+        for root in lib_roots:
+            candidate_path = root / filename
+            if candidate_path.exists():
+                paths.append(str(candidate_path))
+    return tuple(paths)
+
+
+def _library_fallback_filenames(name: str) -> Tuple[str, ...]:
+    filenames = _macos_library_candidates().get(name, ())
+    if name.endswith("-0"):
+        filenames += (f"{name[:-2]}.dylib",)
+    return filenames
+
+
+def _resolve_library_paths(lib_roots: Tuple[Path, ...]) -> dict[str, Tuple[str, ...]]:
+    """Return the existing dylib paths for every name in the candidate table."""
     return {
-        "libgobject-2.0-0": ("libgobject-2.0.dylib", "libgobject-2.0.0.dylib"),
-        "gobject-2.0-0": ("libgobject-2.0.dylib", "libgobject-2.0.0.dylib"),
-        "gobject-2.0": ("libgobject-2.0.dylib", "libgobject-2.0.0.dylib"),
-        "libpango-1.0-0": ("libpango-1.0.dylib", "libpango-1.0.0.dylib"),
-        "pango-1.0-0": ("libpango-1.0.dylib", "libpango-1.0.0.dylib"),
-        "pango-1.0": ("libpango-1.0.dylib", "libpango-1.0.0.dylib"),
-        "libharfbuzz-0": ("libharfbuzz.dylib", "libharfbuzz.0.dylib"),
-        "harfbuzz": ("libharfbuzz.dylib", "libharfbuzz.0.dylib"),
-        "harfbuzz-0.0": ("libharfbuzz.dylib", "libharfbuzz.0.dylib"),
-        "libharfbuzz-subset-0": (
-            "libharfbuzz-subset.dylib",
-            "libharfbuzz-subset.0.dylib",
-        ),
-        "harfbuzz-subset": ("libharfbuzz-subset.dylib", "libharfbuzz-subset.0.dylib"),
-        "harfbuzz-subset-0.0": (
-            "libharfbuzz-subset.dylib",
-            "libharfbuzz-subset.0.dylib",
-        ),
-        "libfontconfig-1": ("libfontconfig.dylib", "libfontconfig.1.dylib"),
-        "fontconfig-1": ("libfontconfig.dylib", "libfontconfig.1.dylib"),
-        "fontconfig": ("libfontconfig.dylib", "libfontconfig.1.dylib"),
-        "libpangoft2-1.0-0": ("libpangoft2-1.0.dylib", "libpangoft2-1.0.0.dylib"),
-        "pangoft2-1.0-0": ("libpangoft2-1.0.dylib", "libpangoft2-1.0.0.dylib"),
-        "pangoft2-1.0": ("libpangoft2-1.0.dylib", "libpangoft2-1.0.0.dylib"),
-        "libcairo": ("libcairo.dylib", "libcairo.2.dylib"),
-        "cairo": ("libcairo.dylib", "libcairo.2.dylib"),
+        name: _existing_library_paths(lib_roots, _library_fallback_filenames(name))
+        for name in _macos_library_candidates()
     }
 
 
 def patch_cffi_dlopen(prefixes: Iterable[Path] | None = None) -> None:
     """Monkey patch cffi.FFI.dlopen to try absolute Homebrew paths on macOS."""
-    if sys.platform != "darwin":
+    if not _IS_MACOS:
+        return
+    lib_roots = tuple(prefix / "lib" for prefix in (prefixes or _existing_prefixes()))
+    if not lib_roots:
+        # Without Homebrew there is nothing to fall back to; skip importing cffi.
         return
     try:
         import cffi  # type: ignore
@@ -89,23 +141,17 @@ def patch_cffi_dlopen(prefixes: Iterable[Path] | None = None) -> None:
     if getattr(ffi_type.dlopen, "_accountingplus_patched", False):
         return
 
-    lib_roots = tuple(str(prefix / "lib") for prefix in (prefixes or _existing_prefixes()))
-    library_candidates = _macos_library_candidates()
     original_dlopen = ffi_type.dlopen
+    # Homebrew libraries do not move while the process is running, so resolve
+    # every known name once and memoize lookups for names outside the table.
+    resolved_paths = _resolve_library_paths(lib_roots)
 
     def _fallback(name: str) -> Iterable[str]:
-        candidates = library_candidates.get(name, ())
-        for candidate in candidates:
-            for root in lib_roots:
-                candidate_path = Path(root) / candidate
-                if candidate_path.exists():
-                    yield str(candidate_path)
-        if name.endswith("-0"):
-            trimmed = f"{name[:-2]}.dylib"
-            for root in lib_roots:
-                candidate_path = Path(root) / trimmed
-                if candidate_path.exists():
-                    yield str(candidate_path)
+        paths = resolved_paths.get(name)
+        if paths is None:
+            paths = _existing_library_paths(lib_roots, _library_fallback_filenames(name))
+            resolved_paths[name] = paths
+        return paths
 
     def patched_dlopen(self, name, flags=0):
         try:
@@ -7,3 +7,6 @@ class PersonsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "persons"
     verbose_name = "Облікові особи"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, cast
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm, PasswordChangeForm
+from django.db.models import Count, Q, QuerySet
+from django.forms.models import ModelChoiceIterator
 from django.utils.formats import get_format
+from django.utils.functional import cached_property
+from django.utils.translation import get_language
 
 from .models import Person
 from .tck_reference_data import get_tck_names
@@ -20,16 +26,43 @@ DOC_TYPE_CHOICES = [
     ("Військовий квиток", "Військовий квиток"),
     ("Приписне посвідчення", "Приписне посвідчення"),
 ]
-DOC_TYPE_NUMBER_ONLY_VALUES = {
-    "Військово-обліковий документ",
-    "Резерв+",
-}
+DOC_TYPE_VALUES = frozenset(value for value, _ in DOC_TYPE_CHOICES)
+DOC_TYPE_NUMBER_ONLY_VALUES = frozenset(
+    {
+        "Військово-обліковий документ",
+        "Резерв+",
+    }
+)
 DEFAULT_DOC_SERIES_LABEL = "Серія та номер"
 DEFAULT_DOC_NUMBER_LABEL = "Номер"
 DEFAULT_DOC_SERIES_PLACEHOLDER = "Введіть серію та номер"
 DEFAULT_DOC_NUMBER_PLACEHOLDER = "Введіть номер"
 DEFAULT_PASSPORT_SERIES_LABEL = "Серія та номер"
 DEFAULT_PASSPORT_NUMBER_LABEL = "Номер"
+SELECT_DEFAULT_ATTRS: Dict[str, Any] = {"class": COMMON_SELECT_CLASSES}
+INPUT_DEFAULT_ATTRS: Dict[str, Any] = {"class": COMMON_INPUT_CLASSES}
+TEXT_INPUT_DEFAULT_ATTRS: Dict[str, Any] = {"class": COMMON_INPUT_CLASSES, "autocomplete": "off"}
+DOC_SERIES_DATA_ATTRS: Dict[str, Any] = {
+    "data-label-number": DEFAULT_DOC_NUMBER_LABEL,
+    "data-label-series": DEFAULT_DOC_SERIES_LABEL,
+    "data-placeholder-number": DEFAULT_DOC_NUMBER_PLACEHOLDER,
+    "data-placeholder-series": DEFAULT_DOC_SERIES_PLACEHOLDER,
+}
+PASSPORT_SERIES_DATA_ATTRS: Dict[str, Any] = {
+    "data-label-number": DEFAULT_PASSPORT_NUMBER_LABEL,
+    "data-label-series": DEFAULT_PASSPORT_SERIES_LABEL,
+    "data-passport-type-value-book": Person.PASSPORT_TYPE_BOOK,
+    "data-passport-type-value-id": Person.PASSPORT_TYPE_ID_CARD,
+}
+PERSON_SELECTION_PAGE_SIZE = 50
+PERSON_ORDERING: Tuple[str, ...] = tuple(
+    Person._meta.ordering or ("last_name", "first_name", "middle_name")
+)
+RULES_BULK_CATEGORIES: Dict[str, str] = {
+    "conscripts": "призовник",
+    "liable": "військовозобовʼязаний",
+    "reservists": "резервіст",
+}
 RULES_BULK_CHOICES = [
     ("all", "Усі"),
     ("conscripts", "Призовники"),
@@ -42,12 +75,44 @@ def _ensure_widget_attrs(field: forms.Field) -> Dict[str, Any]:
     """Return a mutable attrs dict for the field's widget."""
     widget = cast(forms.Widget, field.widget)
     attrs = getattr(widget, "attrs", None)
-    if not isinstance(attrs, dict):
-        attrs = dict(attrs or {})
-    setattr(widget, "attrs", attrs)
+    if type(attrs) is dict:
+        return attrs
+    attrs = dict(attrs or {})
+    widget.attrs = attrs
+    return attrs
+
+
+def _apply_default_attrs(field: forms.Field, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge ``defaults`` into the widget attrs without overriding explicit values."""
+    widget = cast(forms.Widget, field.widget)
+    attrs = {**defaults, **(getattr(widget, "attrs", None) or {})}
+    widget.attrs = attrs
     return attrs
 
 
+_INVALID_CLASS_BY_BASE: Dict[str, str] = {
+    COMMON_INPUT_CLASSES: f"{COMMON_INPUT_CLASSES} is-invalid",
+    COMMON_SELECT_CLASSES: f"{COMMON_SELECT_CLASSES} is-invalid",
+    "": "is-invalid",
+}
+
+
+def _with_invalid_class(css_class: str) -> str:
+    """Return ``css_class`` extended with the Bootstrap error marker."""
+    invalid_class = _INVALID_CLASS_BY_BASE.get(css_class)
+    if invalid_class is None:
+        invalid_class = _INVALID_CLASS_BY_BASE.setdefault(
+            css_class, f"{css_class.strip()} is-invalid".strip()
+        )
+    return invalid_class
+
+
+@lru_cache(maxsize=8)
+def _choices_digest(choices: Tuple[str, ...]) -> str:
+    """Return a stable fingerprint of ``choices`` for template fragment cache keys."""
+    return hashlib.md5("\n".join(choices).encode("utf-8")).hexdigest()
+
+
 class TckAutocompleteWidget(forms.TextInput):
     template_name = "persons/widgets/tck_autocomplete.html"
 
@@ -56,13 +121,29 @@ class TckAutocompleteWidget(forms.TextInput):
         *args: Any,
         datalist_id: str = "tcksp-options",
         choices: Optional[Sequence[str]] = None,
+        choices_callable: Optional[Callable[[], Sequence[str]]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.datalist_id = datalist_id
-        self.choices = list(choices or [])
+        self.choices_callable = choices_callable
+        self._choices: Optional[Tuple[str, ...]] = None
+        if choices_callable is None:
+            self.choices = choices or ()
         self.options_data_id = f"{self.datalist_id}-data"
 
+    @property
+    def choices(self) -> Tuple[str, ...]:
+        """Options for the datalist, resolved from ``choices_callable`` on first render."""
+        if self._choices is None:
+            self._choices = tuple(self.choices_callable() if self.choices_callable else ())
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: Sequence[str]) -> None:
+        # Tuples (such as the cached ТЦК names) are shared as-is instead of copied.
+        self._choices = tuple(value)
+
     def get_context(self, name: str, value: Any, attrs: Dict[str, Any]) -> Dict[str, Any]:
         context = super().get_context(name, value, attrs)
         widget = context["widget"]
@@ -71,6 +152,7 @@ class TckAutocompleteWidget(forms.TextInput):
         widget_attrs.setdefault("data-tck-autocomplete", "true")
         widget_attrs.setdefault("data-tck-options-id", self.options_data_id)
         widget["options"] = self.choices
+        widget["options_digest"] = _choices_digest(self.choices)
         widget["datalist_id"] = self.datalist_id
         widget["options_data_id"] = self.options_data_id
         return context
@@ -95,10 +177,9 @@ class AccountingAuthenticationForm(AuthenticationForm):
         super().__init__(*args, **kwargs)
         for name, field in self.fields.items():
             attrs = _ensure_widget_attrs(field)
-            css_class = attrs.get("class", "")
             errors = self.errors
             if errors and errors.get(name):
-                attrs["class"] = f"{css_class} is-invalid".strip()
+                attrs["class"] = _with_invalid_class(attrs.get("class", ""))
 
 
 class AccountPasswordChangeForm(PasswordChangeForm):
@@ -125,8 +206,7 @@ class AccountPasswordChangeForm(PasswordChangeForm):
             if name != "old_password":
                 field.strip = False
             if name in self.errors:
-                classes = attrs.get("class", "").strip()
-                attrs["class"] = f"{classes} is-invalid".strip()
+                attrs["class"] = _with_invalid_class(attrs.get("class", ""))
 
 
 DATE_INPUT_FORMAT = "%Y-%m-%d"
@@ -140,123 +220,152 @@ class DateInput(forms.DateInput):
         super().__init__(*args, **kwargs)
 
 
-def _get_date_input_formats() -> List[str]:
-    formats: List[str] = [DATE_INPUT_FORMAT]
-    for fmt in get_format("DATE_INPUT_FORMATS"):
-        fmt_str = str(fmt)
-        if fmt_str not in formats:
-            formats.append(fmt_str)
-    return formats
+@lru_cache(maxsize=None)
+def _date_input_formats_for(language: Optional[str]) -> Tuple[str, ...]:
+    formats = dict.fromkeys([DATE_INPUT_FORMAT, *map(str, get_format("DATE_INPUT_FORMATS", language))])
+    return tuple(formats)
+
+
+def _get_date_input_formats() -> Tuple[str, ...]:
+    """Return the accepted date formats for the active language as a shared tuple."""
+    return _date_input_formats_for(get_language())
+
+
+GENDER_FORM_CHOICES = [("", "Оберіть стать")] + list(Person.GENDER_CHOICES)
+
+
+# Django deep-copies widgets per bound field, so one template instance can be shared.
+PERSON_DATE_WIDGET = DateInput(attrs=INPUT_DEFAULT_ATTRS)
+
+
+PERSON_FORM_FIELDS: Tuple[str, ...] = (
+    "last_name",
+    "first_name",
+    "middle_name",
+    "gender",
+    "birth_date",
+    "rnokpp",
+    "address_registered",
+    "address_actual",
+    "phone",
+    "email",
+    "position_name",
+    "appoint_order_date",
+    "dismiss_order_date",
+    "account_category",
+    "mil_rank",
+    "vos_code",
+    "tcksp",
+    "edrpvr_number",
+    "doc_type",
+    "doc_series_number",
+    "passport_type",
+    "passport_series_number",
+    "passport_issued_by",
+    "passport_issued_date",
+    "deferral_until",
+    "deferral_reason",
+    "booking_until",
+    "mobil_order_date",
+    "unit_number",
+    "notif_appoint_date",
+    "notif_dismiss_date",
+)
 
 
 class PersonForm(forms.ModelForm):
     class Meta:
         model = Person
-        fields = [
-            "last_name",
-            "first_name",
-            "middle_name",
-            "gender",
-            "birth_date",
-            "rnokpp",
-            "address_registered",
-            "address_actual",
-            "phone",
-            "email",
-            "position_name",
-            "appoint_order_date",
-            "dismiss_order_date",
-            "account_category",
-            "mil_rank",
-            "vos_code",
-            "tcksp",
-            "edrpvr_number",
-            "doc_type",
-            "doc_series_number",
-            "passport_type",
-            "passport_series_number",
-            "passport_issued_by",
-            "passport_issued_date",
-            "deferral_until",
-            "deferral_reason",
-            "booking_until",
-            "mobil_order_date",
-            "unit_number",
-            "notif_appoint_date",
-            "notif_dismiss_date",
-        ]
+        fields = PERSON_FORM_FIELDS
         widgets = {
             "gender": forms.Select(attrs={"class": COMMON_SELECT_CLASSES}),
-            "birth_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "appoint_order_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "dismiss_order_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "passport_issued_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "deferral_until": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "booking_until": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "mobil_order_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "notif_appoint_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
-            "notif_dismiss_date": DateInput(attrs={"class": COMMON_INPUT_CLASSES}),
+            "birth_date": PERSON_DATE_WIDGET,
+            "appoint_order_date": PERSON_DATE_WIDGET,
+            "dismiss_order_date": PERSON_DATE_WIDGET,
+            "passport_issued_date": PERSON_DATE_WIDGET,
+            "deferral_until": PERSON_DATE_WIDGET,
+            "booking_until": PERSON_DATE_WIDGET,
+            "mobil_order_date": PERSON_DATE_WIDGET,
+            "notif_appoint_date": PERSON_DATE_WIDGET,
+            "notif_dismiss_date": PERSON_DATE_WIDGET,
             "deferral_reason": forms.Textarea(attrs={"class": COMMON_INPUT_CLASSES, "rows": 2}),
             "account_category": forms.Select(attrs={"class": COMMON_SELECT_CLASSES}),
             "doc_type": forms.Select(attrs={"class": COMMON_SELECT_CLASSES}),
             "passport_type": forms.Select(attrs={"class": COMMON_SELECT_CLASSES}),
+            "tcksp": TckAutocompleteWidget(
+                choices_callable=get_tck_names,
+                attrs={
+                    "class": COMMON_INPUT_CLASSES,
+                    "autocomplete": "off",
+                    "placeholder": "Почніть вводити назву ТЦК та СП",
+                },
+            ),
         }
 
+    _META_WIDGET_KEYS: ClassVar[frozenset[str]] = frozenset(Meta.widgets)
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         gender_field = self.fields.get("gender")
         if gender_field is not None:
-            gender_field.choices = [("", "Оберіть стать")] + list(Person.GENDER_CHOICES)
-        tcksp_field = self.fields.get("tcksp")
-        if tcksp_field is not None:
-            widget = TckAutocompleteWidget(
-                choices=get_tck_names(),
-                attrs={"placeholder": "Почніть вводити назву ТЦК та СП"},
-            )
-            tcksp_field.widget = widget
+            gender_field.choices = GENDER_FORM_CHOICES
         doc_type_field = self.fields.get("doc_type")
         if doc_type_field is not None and isinstance(doc_type_field.widget, forms.Select):
             doc_type_choices = list(DOC_TYPE_CHOICES)
             current_value = self.initial.get("doc_type") or getattr(self.instance, "doc_type", "")
-            if current_value and all(value != current_value for value, _ in DOC_TYPE_CHOICES):
+            if current_value and current_value not in DOC_TYPE_VALUES:
                 doc_type_choices.append((current_value, current_value))
             doc_type_field.widget.choices = doc_type_choices
         doc_series_field = self.fields.get("doc_series_number")
         edrpvr_field = self.fields.get("edrpvr_number")
         passport_type_field = self.fields.get("passport_type")
         passport_series_field = self.fields.get("passport_series_number")
-        doc_type_value: str = ""
-        if doc_type_field is not None:
-            doc_type_key = self.add_prefix("doc_type")
-            if self.is_bound:
-                doc_type_value = str(self.data.get(doc_type_key, "")).strip()
-            else:
-                doc_type_value = str(
-                    self.initial.get("doc_type") or getattr(self.instance, "doc_type", "")
-                ).strip()
-        passport_type_value: str = ""
-        if passport_type_field is not None:
-            passport_type_key = self.add_prefix("passport_type")
-            if self.is_bound:
-                passport_type_value = str(self.data.get(passport_type_key, "")).strip()
-            else:
-                passport_type_value = str(
-                    self.initial.get("passport_type") or getattr(self.instance, "passport_type", "")
-                ).strip()
+        is_bound = self.is_bound
+        data_get = self.data.get
+        initial_get = self.initial.get
+        instance = self.instance
+
+        def _current_value(field_name: str) -> str:
+            if is_bound:
+                return str(data_get(self.add_prefix(field_name), "")).strip()
+            return str(initial_get(field_name) or getattr(instance, field_name, "")).strip()
+
+        # An unbound form for an unsaved person (the create page GET) has no
+        # document values to resolve, so the default labels apply as-is.
+        has_values = (
+            is_bound
+            or instance.pk is not None
+            or bool(initial_get("doc_type") or initial_get("passport_type"))
+        )
+        doc_type_value = (
+            _current_value("doc_type") if has_values and doc_type_field is not None else ""
+        )
+        passport_type_value = (
+            _current_value("passport_type")
+            if has_values and passport_type_field is not None
+            else ""
+        )
+        form_auto_id = self.auto_id
+
+        def _auto_id(field_name: str) -> str:
+            # Same result as ``self[field_name].auto_id`` without building a
+            # BoundField during ``__init__`` just to read its id.
+            html_name = self.add_prefix(field_name)
+            if form_auto_id and "%s" in str(form_auto_id):
+                return form_auto_id % html_name
+            return html_name if form_auto_id else ""
+
+        doc_type_auto_id = _auto_id("doc_type") if doc_type_field is not None else ""
+        passport_type_auto_id = (
+            _auto_id("passport_type") if passport_type_field is not None else ""
+        )
+        edrpvr_auto_id = _auto_id("edrpvr_number") if edrpvr_field is not None else ""
         if doc_series_field is not None:
-            doc_series_attrs = _ensure_widget_attrs(doc_series_field)
-            doc_series_attrs.setdefault("data-label-number", DEFAULT_DOC_NUMBER_LABEL)
-            doc_series_attrs.setdefault("data-label-series", DEFAULT_DOC_SERIES_LABEL)
-            doc_series_attrs.setdefault("data-placeholder-number", DEFAULT_DOC_NUMBER_PLACEHOLDER)
-            doc_series_attrs.setdefault("data-placeholder-series", DEFAULT_DOC_SERIES_PLACEHOLDER)
-            if edrpvr_field is not None:
-                edrpvr_auto_id = self["edrpvr_number"].auto_id
-                if edrpvr_auto_id:
-                    doc_series_attrs.setdefault("data-edrpvr-input-id", edrpvr_auto_id)
-            if doc_type_field is not None:
-                doc_type_auto_id = self["doc_type"].auto_id
-                if doc_type_auto_id:
-                    doc_series_attrs.setdefault("data-doc-type-input-id", doc_type_auto_id)
+            doc_series_attrs = _apply_default_attrs(doc_series_field, DOC_SERIES_DATA_ATTRS)
+            if edrpvr_auto_id:
+                doc_series_attrs.setdefault("data-edrpvr-input-id", edrpvr_auto_id)
+            if doc_type_auto_id:
+                doc_series_attrs.setdefault("data-doc-type-input-id", doc_type_auto_id)
             if doc_type_value in DOC_TYPE_NUMBER_ONLY_VALUES:
                 doc_series_field.label = DEFAULT_DOC_NUMBER_LABEL
                 doc_series_attrs["placeholder"] = DEFAULT_DOC_NUMBER_PLACEHOLDER
@@ -264,45 +373,61 @@ class PersonForm(forms.ModelForm):
                 doc_series_field.label = DEFAULT_DOC_SERIES_LABEL
                 doc_series_attrs["placeholder"] = DEFAULT_DOC_SERIES_PLACEHOLDER
         if passport_series_field is not None:
-            passport_series_attrs = _ensure_widget_attrs(passport_series_field)
-            passport_series_attrs.setdefault("data-label-number", DEFAULT_PASSPORT_NUMBER_LABEL)
-            passport_series_attrs.setdefault("data-label-series", DEFAULT_PASSPORT_SERIES_LABEL)
-            passport_series_attrs.setdefault("data-passport-type-value-book", Person.PASSPORT_TYPE_BOOK)
-            passport_series_attrs.setdefault("data-passport-type-value-id", Person.PASSPORT_TYPE_ID_CARD)
-            if passport_type_field is not None:
-                passport_type_auto_id = self["passport_type"].auto_id
-                if passport_type_auto_id:
-                    passport_series_attrs.setdefault("data-passport-type-input-id", passport_type_auto_id)
+            passport_series_attrs = _apply_default_attrs(
+                passport_series_field, PASSPORT_SERIES_DATA_ATTRS
+            )
+            if passport_type_auto_id:
+                passport_series_attrs.setdefault("data-passport-type-input-id", passport_type_auto_id)
             if passport_type_value == Person.PASSPORT_TYPE_ID_CARD:
                 passport_series_field.label = DEFAULT_PASSPORT_NUMBER_LABEL
             else:
                 passport_series_field.label = DEFAULT_PASSPORT_SERIES_LABEL
+        fields = self.fields
+        date_fields, default_attrs = self._field_buckets()
         date_input_formats = _get_date_input_formats()
-        for field_name, field in self.fields.items():
+        for field_name in date_fields:
+            fields[field_name].input_formats = date_input_formats
+        for field_name, defaults in default_attrs:
+            _apply_default_attrs(fields[field_name], defaults)
+        if is_bound:
+            # Walk only the fields that actually failed validation instead of
+            # building a BoundField for every field just to inspect its errors.
+            for field_name, field_errors in self.errors.items():
+                field = fields.get(field_name)
+                if field is None or not field_errors:
+                    continue
+                attrs = _ensure_widget_attrs(field)
+                attrs["class"] = _with_invalid_class(attrs.get("class", ""))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _field_buckets(
+        cls,
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Dict[str, Any]], ...]]:
+        """Return the date field names and the default widget attrs per field.
+
+        ``base_fields`` is built once per class, so the mapping stays valid for
+        the lifetime of the process and ``__init__`` needs no ``isinstance`` checks.
+        """
+        date_fields: List[str] = []
+        default_attrs: List[Tuple[str, Dict[str, Any]]] = []
+        meta_widget_keys = cls._META_WIDGET_KEYS
+        for field_name, field in cls.base_fields.items():
             if isinstance(field, forms.DateField):
-                field.input_formats = list(date_input_formats)
-            if field_name in self.Meta.widgets:
+                date_fields.append(field_name)
+            if field_name in meta_widget_keys:
                 continue
             if isinstance(field.widget, forms.Select):
-                attrs = _ensure_widget_attrs(field)
-                attrs.setdefault("class", COMMON_SELECT_CLASSES)
+                default_attrs.append((field_name, SELECT_DEFAULT_ATTRS))
+            elif isinstance(field.widget, forms.TextInput):
+                default_attrs.append((field_name, TEXT_INPUT_DEFAULT_ATTRS))
             else:
-                attrs = _ensure_widget_attrs(field)
-                attrs.setdefault("class", COMMON_INPUT_CLASSES)
-            if isinstance(field.widget, forms.TextInput):
-                attrs = _ensure_widget_attrs(field)
-                attrs.setdefault("autocomplete", "off")
-        if self.is_bound:
-            for name, field in self.fields.items():
-                bound_field = self[name]
-                if bound_field.errors:
-                    attrs = _ensure_widget_attrs(field)
-                    css_class = attrs.get("class", "")
-                    attrs["class"] = f"{css_class} is-invalid".strip()
+                default_attrs.append((field_name, INPUT_DEFAULT_ATTRS))
+        return tuple(date_fields), tuple(default_attrs)
 
     def get_recommendation_payload(self) -> dict[str, Any]:
-        cleaned_data = {name: self.cleaned_data.get(name) for name in self.Meta.fields}
-        return cleaned_data
+        cleaned_data_get = self.cleaned_data.get
+        return {name: cleaned_data_get(name) for name in PERSON_FORM_FIELDS}
 
 
 class RulesAcknowledgementSelectionForm(forms.Form):
@@ -325,8 +450,12 @@ class RulesAcknowledgementSelectionForm(forms.Form):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        ordering = Person._meta.ordering or ["last_name", "first_name", "middle_name"]
-        self.fields["persons"].queryset = Person.objects.order_by(*ordering)
+        persons_field = cast(forms.ModelMultipleChoiceField, self.fields["persons"])
+        persons_field.queryset = Person.objects.order_by(*PERSON_ORDERING)
+        self.displayed_persons = self._get_displayed_persons(persons_field.queryset)
+        displayed_choices = ModelChoiceIterator(persons_field)
+        displayed_choices.queryset = self.displayed_persons
+        persons_field.widget.choices = displayed_choices
         for name, field in self.fields.items():
             if isinstance(field.widget, forms.CheckboxSelectMultiple):
                 attrs = _ensure_widget_attrs(field)
@@ -334,6 +463,39 @@ class RulesAcknowledgementSelectionForm(forms.Form):
                 if name == "persons":
                     attrs.setdefault("data-rules-bulk-checkbox", "true")
 
+    def _get_displayed_persons(self, queryset: QuerySet[Person]) -> QuerySet[Person]:
+        """Limit the rendered checkboxes to the first page plus the ticked persons.
+
+        Everyone else is loaded on demand through the person search endpoint;
+        validation still runs against the full ``persons`` queryset.
+        """
+        displayed_ids: List[Any] = list(
+            queryset.values_list("pk", flat=True)[:PERSON_SELECTION_PAGE_SIZE]
+        )
+        if self.is_bound:
+            selected_values = self["persons"].value() or []
+            displayed_ids.extend(value for value in selected_values if str(value).isdigit())
+        return queryset.filter(pk__in=displayed_ids)
+
+    @cached_property
+    def bulk_option_totals(self) -> Dict[str, int]:
+        """Number of persons each quick-select option expands to on submit.
+
+        Only part of every category is rendered, so the selection counter
+        reads these instead of counting the loaded checkboxes.
+        """
+        per_category: Dict[str, int] = dict(
+            Person.objects.order_by()
+            .values_list("account_category")
+            .annotate(total=Count("pk"))
+        )
+        totals = {
+            option: per_category.get(category, 0)
+            for option, category in RULES_BULK_CATEGORIES.items()
+        }
+        totals["all"] = sum(per_category.values())
+        return totals
+
     def clean(self) -> Dict[str, Any]:
         cleaned_data = super().clean()
         selected_persons = cleaned_data.get("persons")
@@ -345,28 +507,20 @@ class RulesAcknowledgementSelectionForm(forms.Form):
     def get_selected_persons(self) -> List[Person]:
         if not hasattr(self, "cleaned_data"):
             return []
-        selected_ids: set[int] = set()
         person_qs = self.cleaned_data.get("persons")
-        if person_qs:
-            selected_ids.update(person_qs.values_list("pk", flat=True))
         bulk_options = set(self.cleaned_data.get("bulk_options", []))
-        base_qs = Person.objects.all()
         if "all" in bulk_options:
-            selected_ids.update(base_qs.values_list("pk", flat=True))
-        else:
-            if "conscripts" in bulk_options:
-                selected_ids.update(
-                    base_qs.filter(account_category="призовник").values_list("pk", flat=True)
-                )
-            if "liable" in bulk_options:
-                selected_ids.update(
-                    base_qs.filter(account_category="військовозобовʼязаний").values_list("pk", flat=True)
-                )
-            if "reservists" in bulk_options:
-                selected_ids.update(
-                    base_qs.filter(account_category="резервіст").values_list("pk", flat=True)
-                )
-        if not selected_ids:
+            return list(Person.objects.order_by(*PERSON_ORDERING))
+        selection = Q()
+        if person_qs is not None:
+            # Keep the ticked persons as a subquery; evaluating the queryset here
+            # would fetch every selected row just to test for emptiness.
+            selection |= Q(pk__in=person_qs.values("pk"))
+        categories = [
+            category for option, category in RULES_BULK_CATEGORIES.items() if option in bulk_options
+        ]
+        if categories:
+            selection |= Q(account_category__in=categories)
+        if not selection:
             return []
-        ordering = Person._meta.ordering or ["last_name", "first_name", "middle_name"]
-        return list(Person.objects.filter(pk__in=selected_ids).order_by(*ordering))
+        return list(Person.objects.filter(selection).order_by(*PERSON_ORDERING))
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from persons.models import Person
+
+
+class Command(BaseCommand):
+    help = "Перебудовує поле пошуку для осіб, змінених оминаючи Person.save()."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stale = []
+        for person in Person.objects.only("pk", "search_text", *Person.SEARCH_FIELDS).iterator():
+            search_text = person.build_search_text()
+            if person.search_text != search_text:
+                person.search_text = search_text
+                stale.append(person)
+        Person.objects.bulk_update(stale, ["search_text"], batch_size=500)
+        self.stdout.write(self.style.SUCCESS(f"Оновлено записів: {len(stale)}"))
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.25 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persons', '0004_person_passport_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['account_category'], name='person_acc_cat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['last_name', 'first_name', 'middle_name'], name='person_name_idx'),
+        ),
+    ]
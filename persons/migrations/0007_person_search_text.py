@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+SEARCH_FIELDS = ("last_name", "first_name", "middle_name", "edrpvr_number")
+
+
+def fill_search_text(apps, schema_editor):
+    Person = apps.get_model("persons", "Person")
+    persons = list(Person.objects.only("pk", *SEARCH_FIELDS))
+    for person in persons:
+        person.search_text = "\n".join(
+            getattr(person, name) or "" for name in SEARCH_FIELDS
+        ).lower()
+    Person.objects.bulk_update(persons, ["search_text"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("persons", "0005_person_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="person",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+    ]
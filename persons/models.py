@@ -20,6 +20,8 @@ class Person(models.Model):
         (PASSPORT_TYPE_BOOK, "Паспорт-книжечка"),
         (PASSPORT_TYPE_ID_CARD, "ID-картка"),
     ]
+    # Fields matched by the person search, denormalised into ``search_text``.
+    SEARCH_FIELDS = ("last_name", "first_name", "middle_name", "edrpvr_number")
 
     last_name = models.CharField("Прізвище", max_length=150)
     first_name = models.CharField("Імʼя", max_length=150)
@@ -94,16 +96,36 @@ class Person(models.Model):
     notif_appoint_date = models.DateField("Повідомлення про призначення", blank=True, null=True)
     notif_dismiss_date = models.DateField("Повідомлення про звільнення", blank=True, null=True)
 
+    # Lower-cased SEARCH_FIELDS, one per line, so a search term is a single
+    # LIKE over one column instead of four case-insensitive ones.  It is
+    # filled by the pre_save receiver in signals.py; QuerySet.update() and
+    # bulk_create() bypass it, so bulk writes must set it from
+    # build_search_text() or be followed by ``manage.py rebuild_search_text``.
+    search_text = models.TextField(editable=False, blank=True, default="")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["last_name", "first_name", "middle_name"]
+        indexes = [
+            models.Index(fields=["account_category"], name="person_acc_cat_idx"),
+            models.Index(fields=["last_name", "first_name", "middle_name"], name="person_name_idx"),
+        ]
         verbose_name = "Особа"
         verbose_name_plural = "Особи"
 
     def __str__(self) -> str:
         return f"{self.last_name} {self.first_name} {self.middle_name}".strip()
 
+    def save(self, *args, **kwargs) -> None:
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "search_text" not in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+        super().save(*args, **kwargs)
+
+    def build_search_text(self) -> str:
+        return "\n".join(getattr(self, name) or "" for name in self.SEARCH_FIELDS).lower()
+
     def get_absolute_url(self) -> str:
         return reverse("persons:person_update", args=[self.pk])
@@ -1,76 +1,216 @@
 from __future__ import annotations
 
+import re
 from datetime import date, timedelta
-from typing import Any, List, Optional, Sequence
-
-try:
-    from experta import AS, MATCH, Fact, KnowledgeEngine, Rule
-except ImportError as exc:  # pragma: no cover - defensive guard for missing dependency
-    raise ImportError(
-        "Experta library is required for recommendation support. Install it via 'pip install experta'."
-    ) from exc
-
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+RuleMethod = TypeVar("RuleMethod", bound=Callable[..., None])
+# (method, fields, optional_fields, bit mask of ``fields``)
+RuleSpec = Tuple[Callable[..., None], Tuple[str, ...], Tuple[str, ...], int]
+
+_NON_DIGIT_RE = re.compile(r"\D")
+BANNED_EMAIL_DOMAINS = frozenset(
+    {
+        "mail.ru",
+        "list.ru",
+        "bk.ru",
+        "inbox.ru",
+        "yandex.ru",
+        "yandex.com",
+        "ya.ru",
+        "rambler.ru",
+    }
+)
+
+# Per account category: (field, forbidden, message). A forbidden field is
+# reported when it has a value; a required one when it is present but blank.
+# Rows are in the order the checks were once separate rules, and
+# recommend_category_field_checks sits where those rules were defined, so
+# the messages keep their place in the output.
+CATEGORY_FIELD_CHECKS: Dict[str, Tuple[Tuple[str, bool, str], ...]] = {
+    "призовник": (
+        (
+            "mobil_order_date",
+            True,
+            "Призовник не може мати мобілізаційне розпорядження. Скоригуйте категорію обліку",
+        ),
+        ("mil_rank", True, "Військові звання призовникам не присвоюються"),
+        ("vos_code", True, "Призовники не можуть мати військово-облікову спеціальність"),
+    ),
+    "військовозобовʼязаний": (
+        (
+            "mil_rank",
+            False,
+            "Переконайтесь, що військове звання (принаймні рекрут) відсутнє у військово-обліковому документі",
+        ),
+    ),
+    "резервіст": (
+        (
+            "mil_rank",
+            False,
+            "Перевірте військово-обліковий документ на відсутність записів про присвоєння військового звання",
+        ),
+    ),
+}
+CATEGORY_FIELD_CHECKS_FIELDS = dict.fromkeys(
+    field for checks in CATEGORY_FIELD_CHECKS.values() for field, _, _ in checks
+)
+
+NO_RECOMMENDATIONS_MESSAGE = "Додаткові рекомендації відсутні на основі введених даних."
+
+# Message templates for the notification rules, filled via ``str.format``.
+APPOINT_NOTIFICATION_PENDING = (
+    "Не подано повідомлення до ТЦК та СП про призначення {first_name} {last_name} на посаду. Залишилось {days_left} днів"
+)
+APPOINT_NOTIFICATION_OVERDUE = (
+    "Повідомлення про призначення {first_name} {last_name} на посаду необхідно було подати до {deadline}"
+)
+DISMISS_NOTIFICATION_PENDING = (
+    "Не подано повідомлення до ТЦК та СП про звільнення {first_name} {last_name}. Залишилось {days_left} днів."
+)
+DISMISS_NOTIFICATION_OVERDUE = (
+    "Повідомлення про звільнення {first_name} {last_name} з посади необхідно було подати до {deadline}"
+)
+
+
+def rule(
+    *fields: str,
+    optional: Tuple[str, ...] = (),
+    categories: Optional[Iterable[str]] = None,
+) -> Callable[[RuleMethod], RuleMethod]:
+    """Mark an engine method as a rule fired when every field in ``fields`` is present.
+
+    The matched values are passed as keyword arguments, together with each
+    ``optional`` field (``None`` when it is missing). ``categories`` limits the
+    rule to persons with one of the given account categories.
+    """
+
+    def decorator(method: RuleMethod) -> RuleMethod:
+        method._rule_fields = fields  # type: ignore[attr-defined]
+        method._rule_optional_fields = optional  # type: ignore[attr-defined]
+        method._rule_categories = (  # type: ignore[attr-defined]
+            frozenset(categories) if categories is not None else None
+        )
+        return method
 
-class PersonData(Fact):
-    """Fact that stores data about a person for the expert system."""
-    pass
+    return decorator
 
 
-class PersonRecommendationEngine(KnowledgeEngine):
-    """Small wrapper around Experta KnowledgeEngine for person suggestions."""
+class PersonRecommendationEngine:
+    """Evaluates the recommendation rules against a single person's data."""
 
     RNOKPP_LENGTH = 10
     RNOKPP_BASE_DATE = date(1899, 12, 31)
+    NOTIFICATION_PERIOD = timedelta(days=7)
+
+    # Populated below the class body from the methods decorated with ``rule``.
+    _rules: ClassVar[Tuple[RuleSpec, ...]] = ()
+    # One bit per field any rule reads; a rule's mask has the bits of its
+    # required fields, so a single ``&`` tells whether it can fire.
+    _field_bits: ClassVar[Dict[str, int]] = {}
+    # The rules that apply to a person of each account category, in
+    # definition order; ``_uncategorised_rules`` serves any other category.
+    _uncategorised_rules: ClassVar[Tuple[RuleSpec, ...]] = ()
+    _rules_by_category: ClassVar[Dict[str, Tuple[RuleSpec, ...]]] = {}
 
     def __init__(self) -> None:
-        super().__init__()
+        self._today = date.today()
+        self._parsed_dates: Dict[str, Optional[date]] = {}
+        self._age_cutoffs: Dict[int, date] = {}
+        self._rnokpp_digits: Dict[str, Optional[str]] = {}
         self._recommendations: List[str] = []
 
+    def reset(self) -> None:
+        # Rules compare against a single "today" per run; parsed dates are
+        # only reused within that run.
+        self._today = date.today()
+        self._parsed_dates.clear()
+        self._age_cutoffs.clear()
+        self._rnokpp_digits.clear()
+        self._recommendations = []
+
+    def evaluate(self, data: Mapping[str, Any]) -> List[str]:
+        """Fire every rule whose fields are all present in ``data``.
+
+        Rules fire in the order they are defined on the class, which is the
+        order their recommendations are shown in. Each call starts a fresh
+        recommendations list, so one engine can be reused across persons;
+        call ``reset()`` to move to a new day.
+        """
+        self._recommendations = []
+        rules = self._rules_by_category.get(data.get("account_category"), self._uncategorised_rules)
+        field_bits = self._field_bits
+        present = 0
+        for field in data:
+            present |= field_bits.get(field, 0)
+        for method, fields, optional_fields, mask in rules:
+            if present & mask != mask:
+                continue
+            kwargs = {field: data[field] for field in fields}
+            for field in optional_fields:
+                kwargs[field] = data.get(field)
+            method(self, **kwargs)
+        if len(self._recommendations) > 1:
+            # Overlapping rules must not show the same advice twice.
+            self._recommendations = list(dict.fromkeys(self._recommendations))
+        return self._recommendations
+
+    @classmethod
+    def evaluate_many(cls, rows: Iterable[Mapping[str, Any]]) -> List[List[str]]:
+        """Evaluate each row with one engine so the date and parse caches are shared."""
+        engine = cls()
+        return [engine.evaluate(row) for row in rows]
+
     def _parse_date(self, value: Any) -> Optional[date]:
+        # Model and cleaned form values are already plain dates (or None).
+        if value.__class__ is date:
+            return value
+        if value is None:
+            return None
         if isinstance(value, date):
             return value
         if isinstance(value, str) and value:
             try:
-                return date.fromisoformat(value)
+                return self._parsed_dates[value]
+            except KeyError:
+                pass
+            try:
+                parsed: Optional[date] = date.fromisoformat(value)
             except ValueError:
-                return None
+                parsed = None
+            self._parsed_dates[value] = parsed
+            return parsed
         return None
 
-    def _calculate_age(self, birth_date_value: Any) -> Optional[int]:
+    def _past_birth_date(self, birth_date_value: Any) -> Optional[date]:
         birth = self._parse_date(birth_date_value)
-        if not birth:
-            return None
-        today = date.today()
-        if birth > today:
-            return None
-        years = today.year - birth.year
-        if (today.month, today.day) < (birth.month, birth.day):
-            years -= 1
-        return years
-
-    def _days_until_deadline(self, base_date_value: Any, offset: int) -> Optional[int]:
-        deadline = self._calculate_deadline(base_date_value, offset)
-        if not deadline:
+        if not birth or birth > self._today:
             return None
-        return (deadline - date.today()).days
+        return birth
 
-    def _calculate_deadline(self, base_date_value: Any, offset: int) -> Optional[date]:
-        base_date = self._parse_date(base_date_value)
-        if not base_date:
-            return None
-        return base_date + timedelta(days=offset)
-
-    def _years_since(self, date_value: Any) -> Optional[int]:
-        parsed = self._parse_date(date_value)
-        if not parsed:
-            return None
-        today = date.today()
-        if parsed > today:
-            return 0
-        years = today.year - parsed.year
-        if (today.month, today.day) < (parsed.month, parsed.day):
-            years -= 1
-        return years
+    def _age_cutoff(self, years: int) -> date:
+        """Return the date ``years`` years before today (the latest birth date at that age)."""
+        cutoff = self._age_cutoffs.get(years)
+        if cutoff is None:
+            today = self._today
+            try:
+                cutoff = today.replace(year=today.year - years)
+            except ValueError:
+                cutoff = today.replace(month=2, day=28, year=today.year - years)
+            self._age_cutoffs[years] = cutoff
+        return cutoff
 
     def _add_years(self, date_value: Any, years: int) -> Optional[date]:
         base = self._parse_date(date_value)
@@ -92,10 +232,15 @@ class PersonRecommendationEngine(KnowledgeEngine):
     def _normalize_rnokpp(self, value: Any) -> Optional[str]:
         if not self._has_value(value):
             return None
-        digits = "".join(ch for ch in str(value) if ch.isdigit())
-        if len(digits) != self.RNOKPP_LENGTH:
-            return None
-        return digits
+        text = str(value)
+        try:
+            return self._rnokpp_digits[text]
+        except KeyError:
+            pass
+        digits = _NON_DIGIT_RE.sub("", text)
+        normalized = digits if len(digits) == self.RNOKPP_LENGTH else None
+        self._rnokpp_digits[text] = normalized
+        return normalized
 
     def _rnokpp_ninth_digit(self, rnokpp_value: Any) -> Optional[int]:
         digits = self._normalize_rnokpp(rnokpp_value)
@@ -116,170 +261,74 @@ class PersonRecommendationEngine(KnowledgeEngine):
             return None
         return days
 
-    def _all_fields_present(self, fact: Fact, fields: Sequence[str]) -> bool:
+    def _all_fields_present(self, fact: Mapping[str, Any], fields: Sequence[str]) -> bool:
         return all(self._has_value(fact.get(field)) for field in fields)
 
     def _format_date(self, value: Any) -> Optional[str]:
         parsed = self._parse_date(value)
         if parsed:
-            return parsed.strftime("%d.%m.%Y")
+            return f"{parsed.day:02d}.{parsed.month:02d}.{parsed.year:04d}"
         if isinstance(value, str) and value:
             return value
         return None
 
-    @Rule(PersonData(birth_date=MATCH.birth_date))
-    def recommend_below_service_age(self, birth_date: Any) -> None:  # type: ignore[override]
-        age = self._calculate_age(birth_date)
-        if age is None or age >= 16:
+    @rule("birth_date")
+    def recommend_below_service_age(self, birth_date: Any) -> None:
+        birth = self._past_birth_date(birth_date)
+        if birth is None or birth <= self._age_cutoff(16):
             return
         self._recommendations.append("Особа не досягла віку перебування на військовому обліку")
 
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            birth_date=MATCH.birth_date,
-        )
-    )
-    def recommend_underage_category(
-        self, account_category: str, first_name: str, last_name: str, birth_date: Any
-    ) -> None:  # type: ignore[override]
-        if account_category not in {"призовник", "військовозобовʼязаний"}:
-            return
-        age = self._calculate_age(birth_date)
-        if age is None or age >= 18:
-            return
-        self._recommendations.append("Перевірте визначення категорії обліку неповнолітнього")
-
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            birth_date=MATCH.birth_date,
-        )
+    @rule(
+        "account_category",
+        "first_name",
+        "last_name",
+        "birth_date",
+        categories=("призовник", "військовозобовʼязаний", "резервіст"),
     )
-    def recommend_age_limit(
+    def recommend_age_category(
         self, account_category: str, first_name: str, last_name: str, birth_date: Any
-    ) -> None:  # type: ignore[override]
-        if account_category not in {"військовозобовʼязаний", "резервіст"}:
-            return
-        age = self._calculate_age(birth_date)
-        if age is None or age <= 60:
-            return
-        self._recommendations.append(
-            f"{account_category} {first_name} {last_name} має бути виключений з військового обліку у звʼязку з досягненням граничного віку"
-        )
-
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            mobil_order_date=MATCH.mobil_order_date,
-        )
-    )
-    def recommend_prizovnik_with_mobil_order(
-        self, account_category: str, mobil_order_date: Any
-    ) -> None:  # type: ignore[override]
-        if account_category != "призовник":
-            return
-        if not self._has_value(mobil_order_date):
-            return
-        self._recommendations.append(
-            "Призовник не може мати мобілізаційне розпорядження. Скоригуйте категорію обліку"
-        )
-
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            mil_rank=MATCH.mil_rank,
-        )
-    )
-    def recommend_prizovnik_has_rank(self, account_category: str, mil_rank: Optional[str]) -> None:  # type: ignore[override]
-        if account_category != "призовник":
+    ) -> None:
+        birth = self._past_birth_date(birth_date)
+        if birth is None:
             return
-        if not self._has_value(mil_rank):
-            return
-        self._recommendations.append("Військові звання призовникам не присвоюються")
-
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            vos_code=MATCH.vos_code,
-        )
-    )
-    def recommend_prizovnik_has_vos(self, account_category: str, vos_code: Optional[str]) -> None:  # type: ignore[override]
-        if account_category != "призовник":
-            return
-        if not self._has_value(vos_code):
-            return
-        self._recommendations.append("Призовники не можуть мати військово-облікову спеціальність")
-
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            mil_rank=MATCH.mil_rank,
-        )
-    )
-    def recommend_missing_rank_for_obliged(
-        self, account_category: str, mil_rank: Optional[str]
-    ) -> None:  # type: ignore[override]
-        if account_category != "військовозобовʼязаний":
-            return
-        if self._has_value(mil_rank):
-            return
-        self._recommendations.append(
-            "Переконайтесь, що військове звання (принаймні рекрут) відсутнє у військово-обліковому документі"
-        )
+        if birth > self._age_cutoff(18) and account_category != "резервіст":
+            self._recommendations.append("Перевірте визначення категорії обліку неповнолітнього")
+        elif birth <= self._age_cutoff(61) and account_category != "призовник":
+            self._recommendations.append(
+                f"{account_category} {first_name} {last_name} має бути виключений з військового обліку у звʼязку з досягненням граничного віку"
+            )
 
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            mil_rank=MATCH.mil_rank,
-        )
+    @rule(
+        "account_category",
+        optional=tuple(CATEGORY_FIELD_CHECKS_FIELDS),
+        categories=CATEGORY_FIELD_CHECKS,
     )
-    def recommend_missing_rank_for_reservist(
-        self, account_category: str, mil_rank: Optional[str]
-    ) -> None:  # type: ignore[override]
-        if account_category != "резервіст":
-            return
-        if self._has_value(mil_rank):
-            return
-        self._recommendations.append(
-            "Перевірте військово-обліковий документ на відсутність записів про присвоєння військового звання"
-        )
-
-    @Rule(PersonData(email=MATCH.email))
-    def recommend_unsafe_email(self, email: str) -> None:  # type: ignore[override]
+    def recommend_category_field_checks(self, account_category: str, **values: Any) -> None:
+        for field, forbidden, message in CATEGORY_FIELD_CHECKS[account_category]:
+            value = values[field]
+            if forbidden:
+                if not self._has_value(value):
+                    continue
+            # A missing field is not reported, only one that is present but blank.
+            elif value is None or self._has_value(value):
+                continue
+            self._recommendations.append(message)
+
+    @rule("email")
+    def recommend_unsafe_email(self, email: str) -> None:
         if not self._has_value(email):
             return
-        domain = email.lower().strip().split("@")[-1]
-        banned_domains = {
-            "mail.ru",
-            "list.ru",
-            "bk.ru",
-            "inbox.ru",
-            "yandex.ru",
-            "yandex.com",
-            "ya.ru",
-            "rambler.ru",
-        }
-        if domain in banned_domains:
+        domain = email.strip().rpartition("@")[2].lower()
+        if domain in BANNED_EMAIL_DOMAINS:
             self._recommendations.append(
                 "Використовується email-сервіс держави-агресора. Негайно змініть email!"
             )
 
-    @Rule(
-        PersonData(
-            gender=MATCH.gender,
-            rnokpp=MATCH.rnokpp,
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-        )
-    )
+    @rule("gender", "rnokpp", "first_name", "last_name")
     def recommend_rnokpp_gender_parity_male(
         self, gender: str, rnokpp: Any, first_name: str, last_name: str
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if gender != "male":
             return
         ninth_digit = self._rnokpp_ninth_digit(rnokpp)
@@ -289,17 +338,10 @@ class PersonRecommendationEngine(KnowledgeEngine):
             f"{first_name} {last_name} має \"жіночий\" РНОКПП. Усуньте помилку"
         )
 
-    @Rule(
-        PersonData(
-            gender=MATCH.gender,
-            rnokpp=MATCH.rnokpp,
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-        )
-    )
+    @rule("gender", "rnokpp", "first_name", "last_name")
     def recommend_rnokpp_gender_parity_female(
         self, gender: str, rnokpp: Any, first_name: str, last_name: str
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if gender != "female":
             return
         ninth_digit = self._rnokpp_ninth_digit(rnokpp)
@@ -309,8 +351,8 @@ class PersonRecommendationEngine(KnowledgeEngine):
             f"{first_name} {last_name} має \"чоловічий\" РНОКПП. Усуньте помилку"
         )
 
-    @Rule(PersonData(rnokpp=MATCH.rnokpp, birth_date=MATCH.birth_date))
-    def recommend_rnokpp_birthdate_mismatch(self, rnokpp: Any, birth_date: Any) -> None:  # type: ignore[override]
+    @rule("rnokpp", "birth_date")
+    def recommend_rnokpp_birthdate_mismatch(self, rnokpp: Any, birth_date: Any) -> None:
         birth = self._parse_date(birth_date)
         if not birth:
             return
@@ -322,15 +364,7 @@ class PersonRecommendationEngine(KnowledgeEngine):
             return
         self._recommendations.append("У РНОКПП виявлено ймовірну помилку у перших 5 цифрах")
 
-    @Rule(
-        PersonData(
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            deferral_until=MATCH.deferral_until,
-            deferral_reason=MATCH.deferral_reason,
-            booking_until=MATCH.booking_until,
-        )
-    )
+    @rule("first_name", "last_name", "deferral_until", "deferral_reason", "booking_until")
     def recommend_deferral_booking(
         self,
         first_name: str,
@@ -338,7 +372,7 @@ class PersonRecommendationEngine(KnowledgeEngine):
         deferral_until: Any,
         deferral_reason: str,
         booking_until: Any,
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if not deferral_until or not booking_until:
             return
         deferral_text = self._format_date(deferral_until) or str(deferral_until)
@@ -346,113 +380,98 @@ class PersonRecommendationEngine(KnowledgeEngine):
             f"{first_name} {last_name} може не включатися до списку на бронювання до {deferral_text}, адже має відстрочку ({deferral_reason})"
         )
 
-    @Rule(PersonData(deferral_until=MATCH.deferral_until))
-    def recommend_expired_deferral(self, deferral_until: Any) -> None:  # type: ignore[override]
+    @rule("deferral_until")
+    def recommend_expired_deferral(self, deferral_until: Any) -> None:
         expiry = self._parse_date(deferral_until)
         if not expiry:
             return
-        if date.today() <= expiry:
+        if self._today <= expiry:
             return
         self._recommendations.append("Строк дії відстрочки сплив. Оновіть про неї дані")
 
-    @Rule(PersonData(booking_until=MATCH.booking_until))
-    def recommend_expired_booking(self, booking_until: Any) -> None:  # type: ignore[override]
+    @rule("booking_until")
+    def recommend_expired_booking(self, booking_until: Any) -> None:
         expiry = self._parse_date(booking_until)
         if not expiry:
             return
-        if date.today() <= expiry:
+        if self._today <= expiry:
             return
         self._recommendations.append("Строк дії бронювання сплив. Оновіть про нього дані")
 
-    @Rule(
-        PersonData(
-            account_category=MATCH.account_category,
-            position_name=MATCH.position_name,
-            appoint_order_date=MATCH.appoint_order_date,
-        )
-    )
+    @rule("account_category", "position_name", "appoint_order_date")
     def recommend_missing_position_for_appointment(
         self, account_category: str, position_name: Optional[str], appoint_order_date: Any
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if not self._has_value(appoint_order_date):
             return
         if self._has_value(position_name):
             return
         self._recommendations.append(f"Вкажіть на яку посаду призначено {account_category}")
 
-    @Rule(
-        AS.person_fact
-        << PersonData(
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            appoint_order_date=MATCH.appoint_order_date,
-        )
-    )
-    def recommend_missing_appoint_notification(
-        self, person_fact: Fact, first_name: str, last_name: str, appoint_order_date: Any
-    ) -> None:  # type: ignore[override]
-        if not appoint_order_date:
-            return
-        notif_appoint_date = person_fact.get("notif_appoint_date")
-        if notif_appoint_date:
-            return
-        deadline = self._calculate_deadline(appoint_order_date, 7)
-        if not deadline:
-            return
-        days_left = self._days_until_deadline(appoint_order_date, 7)
-        if days_left is None:
+    def _check_notification(
+        self,
+        first_name: str,
+        last_name: str,
+        order_date: Any,
+        notif_date: Any,
+        pending_message: str,
+        overdue_message: str,
+    ) -> None:
+        if not order_date or notif_date:
+            return
+        base_date = self._parse_date(order_date)
+        if not base_date:
             return
+        deadline = base_date + self.NOTIFICATION_PERIOD
+        days_left = (deadline - self._today).days
         if days_left > 0:
             self._recommendations.append(
-                f"Не подано повідомлення до ТЦК та СП про призначення {first_name} {last_name} на посаду. Залишилось {days_left} днів"
+                pending_message.format(first_name=first_name, last_name=last_name, days_left=days_left)
             )
             return
         deadline_text = self._format_date(deadline) or str(deadline)
         self._recommendations.append(
-            f"Повідомлення про призначення {first_name} {last_name} на посаду необхідно було подати до {deadline_text}"
+            overdue_message.format(first_name=first_name, last_name=last_name, deadline=deadline_text)
         )
 
-    @Rule(
-        AS.person_fact
-        << PersonData(
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            dismiss_order_date=MATCH.dismiss_order_date,
+    @rule("first_name", "last_name", "appoint_order_date", optional=("notif_appoint_date",))
+    def recommend_missing_appoint_notification(
+        self,
+        first_name: str,
+        last_name: str,
+        appoint_order_date: Any,
+        notif_appoint_date: Any,
+    ) -> None:
+        self._check_notification(
+            first_name,
+            last_name,
+            appoint_order_date,
+            notif_appoint_date,
+            APPOINT_NOTIFICATION_PENDING,
+            APPOINT_NOTIFICATION_OVERDUE,
         )
-    )
+
+    @rule("first_name", "last_name", "dismiss_order_date", optional=("notif_dismiss_date",))
     def recommend_missing_dismiss_notification(
-        self, person_fact: Fact, first_name: str, last_name: str, dismiss_order_date: Any
-    ) -> None:  # type: ignore[override]
-        if not dismiss_order_date:
-            return
-        notif_dismiss_date = person_fact.get("notif_dismiss_date")
-        if notif_dismiss_date:
-            return
-        deadline = self._calculate_deadline(dismiss_order_date, 7)
-        if not deadline:
-            return
-        days_left = self._days_until_deadline(dismiss_order_date, 7)
-        if days_left is None:
-            return
-        if days_left > 0:
-            self._recommendations.append(
-                f"Не подано повідомлення до ТЦК та СП про звільнення {first_name} {last_name}. Залишилось {days_left} днів."
-            )
-            return
-        deadline_text = self._format_date(deadline) or str(deadline)
-        self._recommendations.append(
-            f"Повідомлення про звільнення {first_name} {last_name} з посади необхідно було подати до {deadline_text}"
+        self,
+        first_name: str,
+        last_name: str,
+        dismiss_order_date: Any,
+        notif_dismiss_date: Any,
+    ) -> None:
+        self._check_notification(
+            first_name,
+            last_name,
+            dismiss_order_date,
+            notif_dismiss_date,
+            DISMISS_NOTIFICATION_PENDING,
+            DISMISS_NOTIFICATION_OVERDUE,
         )
 
-    @Rule(
-        PersonData(
-            birth_date=MATCH.birth_date,
-            mobil_order_date=MATCH.mobil_order_date,
-        )
-    )
+    @rule("birth_date", "mobil_order_date")
     def recommend_mobil_order_underage(
         self, birth_date: Any, mobil_order_date: Any
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         birth = self._parse_date(birth_date)
         mobil = self._parse_date(mobil_order_date)
         if not birth or not mobil:
@@ -465,15 +484,10 @@ class PersonRecommendationEngine(KnowledgeEngine):
                 "Мобілізаційне розпорядження не може бути видано неповнолітній особі"
             )
 
-    @Rule(
-        PersonData(
-            mobil_order_date=MATCH.mobil_order_date,
-            unit_number=MATCH.unit_number,
-        )
-    )
+    @rule("mobil_order_date", "unit_number")
     def recommend_missing_unit_number(
         self, mobil_order_date: Any, unit_number: Optional[str]
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if not self._has_value(mobil_order_date):
             return
         if self._has_value(unit_number):
@@ -482,15 +496,10 @@ class PersonRecommendationEngine(KnowledgeEngine):
             "Не вказано номер військової частини у мобілізаційному розпорядженні"
         )
 
-    @Rule(
-        PersonData(
-            mobil_order_date=MATCH.mobil_order_date,
-            unit_number=MATCH.unit_number,
-        )
-    )
+    @rule("mobil_order_date", "unit_number")
     def recommend_missing_mobil_order_date(
         self, mobil_order_date: Any, unit_number: Optional[str]
-    ) -> None:  # type: ignore[override]
+    ) -> None:
         if self._has_value(mobil_order_date):
             return
         if not self._has_value(unit_number):
@@ -499,70 +508,93 @@ class PersonRecommendationEngine(KnowledgeEngine):
             "Не вказано дату видачі мобілізаційного розпорядження"
         )
 
-    @Rule(PersonData(birth_date=MATCH.birth_date))
-    def recommend_birth_date_check(self, birth_date: Any) -> None:  # type: ignore[override]
-        age = self._calculate_age(birth_date)
-        if age is None or age <= 125:
+    @rule("birth_date")
+    def recommend_birth_date_check(self, birth_date: Any) -> None:
+        birth = self._past_birth_date(birth_date)
+        if birth is None or birth > self._age_cutoff(126):
             return
         self._recommendations.append("Переконайтеся, що дата народження вказана правильно")
 
-    @Rule(
-        PersonData(
-            address_registered=MATCH.address_registered,
-            address_actual=MATCH.address_actual,
-        )
-    )
-    def recommend_single_address(self, address_registered: str, address_actual: str) -> None:  # type: ignore[override]
-        if not address_registered or not address_actual:
-            return
-        if address_registered != address_actual:
-            return
-        self._recommendations.append("Вказуйте лише задеклароване місце проживання")
-
-    @Rule(
-        PersonData(
-            address_registered=MATCH.address_registered,
-            address_actual=MATCH.address_actual,
-        )
-    )
-    def recommend_dual_address(self, address_registered: str, address_actual: str) -> None:  # type: ignore[override]
+    @rule("address_registered", "address_actual")
+    def recommend_address_consistency(self, address_registered: str, address_actual: str) -> None:
         if not address_registered or not address_actual:
             return
         if address_registered == address_actual:
-            return
-        self._recommendations.append("Необхідно зазначити задеклароване та фактичне місце проживання")
+            self._recommendations.append("Вказуйте лише задеклароване місце проживання")
+        else:
+            self._recommendations.append("Необхідно зазначити задеклароване та фактичне місце проживання")
 
-    @Rule(AS.person_fact << PersonData())
-    def recommend_missing_edrpvr(self, person_fact: Fact) -> None:  # type: ignore[override]
-        if self._has_value(person_fact.get("edrpvr_number")):
+    @rule(optional=("edrpvr_number",))
+    def recommend_missing_edrpvr(self, edrpvr_number: Optional[str]) -> None:
+        if self._has_value(edrpvr_number):
             return
         self._recommendations.append("Додайте номер у ЄДРПВР")
 
-    @Rule(
-        PersonData(
-            first_name=MATCH.first_name,
-            last_name=MATCH.last_name,
-            passport_issued_date=MATCH.passport_issued_date,
-        )
-    )
+    @rule("first_name", "last_name", "passport_issued_date")
     def recommend_passport_update(
         self,
         first_name: str,
         last_name: str,
         passport_issued_date: Any,
-    ) -> None:  # type: ignore[override]
-        years = self._years_since(passport_issued_date)
-        if years is None or years <= 10:
+    ) -> None:
+        issued = self._parse_date(passport_issued_date)
+        # More than ten full years since issue, i.e. at least eleven.
+        if not issued or issued > self._age_cutoff(11):
             return
-        expiry_date = self._add_years(passport_issued_date, 10)
-        expiry_text = self._format_date(expiry_date) if expiry_date else None
-        if expiry_text:
-            expiry_text = f"{expiry_text}"
-        else:
-            expiry_text = "[невідомо]"
+        expiry_date = self._add_years(issued, 10)
+        expiry_text = (self._format_date(expiry_date) if expiry_date else None) or "[невідомо]"
         self._recommendations.append(
             f"Оновіть дані про паспорт (ID-картку) термін дії якого сплив {expiry_text}"
         )
 
     def get_recommendations(self) -> List[str]:
         return self._recommendations
+
+
+_rule_methods = [
+    method for method in vars(PersonRecommendationEngine).values() if hasattr(method, "_rule_fields")
+]
+PersonRecommendationEngine._field_bits = {
+    field: 1 << index
+    for index, field in enumerate(
+        dict.fromkeys(field for method in _rule_methods for field in method._rule_fields)
+    )
+}
+
+
+def _fields_mask(fields: Iterable[str]) -> int:
+    mask = 0
+    for field in fields:
+        mask |= PersonRecommendationEngine._field_bits[field]
+    return mask
+
+
+PersonRecommendationEngine._rules = tuple(
+    (
+        method,
+        method._rule_fields,
+        method._rule_optional_fields,
+        _fields_mask(method._rule_fields),
+    )
+    for method in _rule_methods
+)
+del _rule_methods
+
+
+def _rules_for_category(rules: Sequence[RuleSpec], category: Optional[str]) -> Tuple[RuleSpec, ...]:
+    return tuple(
+        spec
+        for spec in rules
+        if spec[0]._rule_categories is None  # type: ignore[attr-defined]
+        or category in spec[0]._rule_categories  # type: ignore[attr-defined]
+    )
+
+
+PersonRecommendationEngine._uncategorised_rules = _rules_for_category(
+    PersonRecommendationEngine._rules, None
+)
+PersonRecommendationEngine._rules_by_category = {
+    category: _rules_for_category(PersonRecommendationEngine._rules, category)
+    for spec in PersonRecommendationEngine._rules
+    for category in (spec[0]._rule_categories or ())  # type: ignore[attr-defined]
+}
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from .models import Person
+
+
+@receiver(pre_save, sender=Person)
+def fill_search_text(sender: type[Person], instance: Person, **kwargs: Any) -> None:
+    # Runs for raw saves too, so fixtures loaded with loaddata are searchable.
+    instance.search_text = instance.build_search_text()
@@ -4,7 +4,7 @@ import re
 from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, MutableMapping, Optional, Set
+from typing import Any, Dict, Iterable, List, MutableMapping, NamedTuple, Optional, Set, Tuple
 
 from django.conf import settings
 
@@ -43,6 +43,31 @@ OBLAST_FROM_HEADING: Dict[str, str] = {
 
 EXCLUDED_TCK_NAMES: Set[str] = {"Вінницький обʼєднаний міський ТЦК та СП"}
 
+# "# " oblast, "## "/"### " ТЦК entry, "#### " contact section.
+_MAX_HEADING_DEPTH = 4
+_TEL_HREF_DISALLOWED_RE = re.compile(r"[^0-9+]")
+
+
+class TckContact(NamedTuple):
+    text: str
+    href: str
+
+
+class TckSection(NamedTuple):
+    title: str
+    type: str
+    items: Tuple[TckContact, ...]
+
+
+class TckEntry(NamedTuple):
+    title: str
+    sections: Tuple[TckSection, ...]
+
+
+class TckRegion(NamedTuple):
+    name: str
+    entries: Tuple[TckEntry, ...]
+
 
 def _strip_contact_value(value: str) -> str:
     """Return the value without surrounding whitespace and NBSP characters."""
@@ -53,7 +78,7 @@ def _strip_contact_value(value: str) -> str:
 def _normalise_tel_href(value: str) -> str:
     """Prepare a value that can be safely used in a tel: hyperlink."""
 
-    cleaned = re.sub(r"[^0-9+]", "", value)
+    cleaned = _TEL_HREF_DISALLOWED_RE.sub("", value)
     return cleaned
 
 
@@ -61,13 +86,43 @@ def _get_data_file() -> Path:
     return Path(settings.BASE_DIR) / "data" / "tckdataforlist.md"
 
 
+def _freeze_regions(regions: Iterable[Dict[str, Any]]) -> Tuple[TckRegion, ...]:
+    """Convert the parsed dicts into the shared read-only tuples."""
+
+    return tuple(
+        TckRegion(
+            region["name"],
+            tuple(
+                TckEntry(
+                    entry["title"],
+                    tuple(
+                        TckSection(
+                            section["title"],
+                            section["type"],
+                            tuple(TckContact(item["text"], item["href"]) for item in section["items"]),
+                        )
+                        for section in entry["sections"]
+                    ),
+                )
+                for entry in region["entries"]
+            ),
+        )
+        for region in regions
+    )
+
+
 @lru_cache(maxsize=1)
-def get_tck_reference_data() -> List[Dict[str, object]]:
-    """Parse the Markdown data file and return structured contact data."""
+def get_tck_reference_data() -> Tuple[TckRegion, ...]:
+    """Return structured contact data parsed from the Markdown data file."""
 
     data_file = _get_data_file()
     if not data_file.exists():
-        return []
+        return ()
+    return _freeze_regions(_parse_tck_reference_data(data_file))
+
+
+def _parse_tck_reference_data(data_file: Path) -> List[Dict[str, object]]:
+    """Parse the Markdown data file and return structured contact data."""
 
     oblasts: MutableMapping[str, Dict[str, object]] = OrderedDict()
     current_oblast: Optional[Dict[str, object]] = None
@@ -79,51 +134,37 @@ def get_tck_reference_data() -> List[Dict[str, object]]:
         if not line:
             continue
 
-        if line.startswith("### "):
-            title = line[4:].strip()
-            if current_oblast is None:
+        # "#" to "####" followed by a space; the hash run's length is the depth.
+        head, sep, rest = line.partition(" ") if line[0] == "#" else ("", "", "")
+        if sep and len(head) <= _MAX_HEADING_DEPTH and not head.strip("#"):
+            depth = len(head)
+            title = rest.strip()
+            if depth == 4:
+                if current_entry is None:
+                    continue
+                section_title = title.rstrip(":")
+                section_type = "email" if "email" in section_title.lower() else "phone"
+                current_section = {
+                    "title": section_title,
+                    "type": section_type,
+                    "items": [],
+                }
+                current_entry["sections"].append(current_section)
                 continue
-            current_entry = {"title": title, "sections": []}
-            current_oblast["entries"].append(current_entry)
-            current_section = None
-            continue
-
-        if line.startswith("## "):
-            title = line[3:].strip()
-            if current_oblast is None:
+            if depth == 1:
+                oblast_name = OBLAST_FROM_HEADING.get(title)
+                if oblast_name is None:
+                    oblast_name = title
+                current_oblast = oblasts.setdefault(
+                    oblast_name, {"name": oblast_name, "entries": []}
+                )
+            elif current_oblast is None:
                 continue
             current_entry = {"title": title, "sections": []}
             current_oblast["entries"].append(current_entry)
             current_section = None
             continue
 
-        if line.startswith("# "):
-            title = line[2:].strip()
-            oblast_name = OBLAST_FROM_HEADING.get(title)
-            if oblast_name is None:
-                oblast_name = title
-            current_oblast = oblasts.setdefault(
-                oblast_name, {"name": oblast_name, "entries": []}
-            )
-            current_entry = {"title": title, "sections": []}
-            current_oblast["entries"].append(current_entry)
-            current_section = None
-            continue
-
-        if line.startswith("#### "):
-            if current_entry is None:
-                continue
-            heading = line[5:].strip()
-            section_title = heading.rstrip(":")
-            section_type = "email" if "email" in section_title.lower() else "phone"
-            current_section = {
-                "title": section_title,
-                "type": section_type,
-                "items": [],
-            }
-            current_entry["sections"].append(current_section)
-            continue
-
         if current_section is None:
             continue
 
@@ -141,24 +182,34 @@ def get_tck_reference_data() -> List[Dict[str, object]]:
     return list(oblasts.values())
 
 
-def count_tck_entries(regions: Iterable[Dict[str, object]]) -> int:
+def count_tck_entries(regions: Iterable[TckRegion]) -> int:
     """Return the total number of individual ТЦК entries across all regions."""
 
-    return sum(len(region.get("entries", [])) for region in regions)
+    return sum(len(region.entries) for region in regions)
+
+
+@lru_cache(maxsize=1)
+def get_tck_entries_total() -> int:
+    """Return the number of ТЦК entries in the cached reference data."""
+
+    return count_tck_entries(get_tck_reference_data())
 
 
 @lru_cache(maxsize=1)
-def get_tck_names() -> List[str]:
-    """Return the ordered list of unique ТЦК назв sourced from the data file."""
+def get_tck_names() -> Tuple[str, ...]:
+    """Return the ordered unique ТЦК назви sourced from the data file.
+
+    The result is cached and shared by every caller, hence the immutable tuple.
+    """
 
     regions = get_tck_reference_data()
     seen: Set[str] = set()
     names: List[str] = []
     for region in regions:
-        for entry in region.get("entries", []):
-            title = str(entry.get("title") or "").strip()
+        for entry in region.entries:
+            title = entry.title.strip()
             if not title or title in seen or title in EXCLUDED_TCK_NAMES:
                 continue
             seen.add(title)
             names.append(title)
-    return names
+    return tuple(names)
@@ -7,16 +7,18 @@ from . import views
 app_name = "persons"
 
 urlpatterns = [
-    path("settings/", views.AccountSettingsView.as_view(), name="settings"),
+    # Ordered by how often each route is hit; the resolver tries them in turn.
     path("", views.PersonListView.as_view(), name="person_list"),
-    path("tck-reference/", views.TckReferenceView.as_view(), name="tck_reference"),
+    path("persons/search/", views.PersonSearchView.as_view(), name="person_search"),
     path("persons/create/", views.PersonCreateView.as_view(), name="person_create"),
     path("persons/<int:pk>/update/", views.PersonUpdateView.as_view(), name="person_update"),
+    path("persons/<int:pk>/rules/", views.PersonRulesView.as_view(), name="person_rules"),
+    path("persons/<int:pk>/rules/pdf/", views.PersonRulesPdfView.as_view(), name="person_rules_pdf"),
     path("persons/<int:pk>/delete/", views.PersonDeleteView.as_view(), name="person_delete"),
     path("persons/recommendations/", views.PersonRecommendationsBulkView.as_view(), name="person_recommendations_bulk"),
     path("persons/recommendations/pdf/", views.PersonRecommendationsBulkPdfView.as_view(), name="person_recommendations_bulk_pdf"),
     path("persons/rules/bulk/", views.PersonRulesBulkView.as_view(), name="person_rules_bulk"),
     path("persons/rules/bulk/pdf/", views.PersonRulesBulkPdfView.as_view(), name="person_rules_bulk_pdf"),
-    path("persons/<int:pk>/rules/", views.PersonRulesView.as_view(), name="person_rules"),
-    path("persons/<int:pk>/rules/pdf/", views.PersonRulesPdfView.as_view(), name="person_rules_pdf"),
+    path("tck-reference/", views.TckReferenceView.as_view(), name="tck_reference"),
+    path("settings/", views.AccountSettingsView.as_view(), name="settings"),
 ]
@@ -5,20 +5,22 @@ from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Any, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import quote_plus
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import PasswordChangeView
-from django.db.models import Q
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import render
-from django.forms.models import model_to_dict
 from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import escape
-from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeString, mark_safe
 from django.utils.text import slugify
 from django.views import View
 from django.views.generic import (
@@ -31,10 +33,29 @@ from django.views.generic import (
     UpdateView,
 )
 
-from .forms import AccountPasswordChangeForm, PersonForm, RulesAcknowledgementSelectionForm
+from .forms import (
+    PERSON_FORM_FIELDS,
+    PERSON_ORDERING,
+    PERSON_SELECTION_PAGE_SIZE,
+    AccountPasswordChangeForm,
+    PersonForm,
+    RulesAcknowledgementSelectionForm,
+)
 from .models import Person
-from .recommendations import PersonRecommendationEngine, PersonData
-from .tck_reference_data import count_tck_entries, get_tck_reference_data
+from .recommendations import NO_RECOMMENDATIONS_MESSAGE, PersonRecommendationEngine
+from .tck_reference_data import get_tck_entries_total, get_tck_reference_data
+
+
+def _search_persons(queryset: QuerySet[Person], query: str) -> QuerySet[Person]:
+    """Keep the persons whose search text contains every whitespace-separated term."""
+
+    # Separators typed between name parts ("Іванов, Іван") are not part of the
+    # stored text; repeated terms would only repeat the same predicate.
+    terms = dict.fromkeys(part.strip(",;") for part in query.lower().split())
+    terms.pop("", None)
+    if not terms:
+        return queryset
+    return queryset.filter(*(Q(search_text__contains=term) for term in terms))
 
 
 class SidebarContextMixin:
@@ -43,9 +64,8 @@ class SidebarContextMixin:
     sidebar_active: str = ""
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-        context.setdefault("sidebar_active", self.sidebar_active)
-        return context
+        kwargs.setdefault("sidebar_active", self.sidebar_active)
+        return super().get_context_data(**kwargs)
 
 
 class RecommendationMixin:
@@ -61,14 +81,9 @@ class RecommendationMixin:
     def form_recommend(self, form: PersonForm) -> HttpResponse:
         data = form.cleaned_data
         engine = PersonRecommendationEngine()
-        engine.reset()
-        engine.declare(PersonData(**{k: v for k, v in data.items() if v not in (None, "")}))
-        engine.run()
-        recommendations = engine.get_recommendations()
+        recommendations = engine.evaluate({k: v for k, v in data.items() if v not in (None, "")})
         if not recommendations:
-            recommendations = [
-                "Додаткові рекомендації відсутні на основі введених даних."
-            ]
+            recommendations = [NO_RECOMMENDATIONS_MESSAGE]
         context = self.get_context_data(form=form, recommendations=recommendations)
         return self.render_to_response(context)
 
@@ -79,43 +94,63 @@ class PersonListView(LoginRequiredMixin, SidebarContextMixin, ListView):
     context_object_name = "persons"
     sidebar_active = "list"
     paginate_by = 25
+    # pk breaks ties between namesakes so pages neither repeat nor skip rows.
+    ordering = (*PERSON_ORDERING, "pk")
+
+    @cached_property
+    def search_query(self) -> str:
+        return self.request.GET.get("q", "").strip()
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        query = self.request.GET.get("q", "").strip()
+        # Only the columns person_list.html renders.
+        queryset = super().get_queryset().only(
+            "pk", "last_name", "first_name", "middle_name", "account_category", "edrpvr_number"
+        )
+        query = self.search_query
         if not query:
             return queryset
 
-        terms = query.split()
-        for term in terms:
-            queryset = queryset.filter(
-                Q(last_name__icontains=term)
-                | Q(first_name__icontains=term)
-                | Q(middle_name__icontains=term)
-                | Q(edrpvr_number__icontains=term)
-            )
-        return queryset
+        return _search_persons(queryset, query)
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context["search_query"] = self.request.GET.get("q", "").strip()
-        query_params = self.request.GET.copy()
-        query_params.pop("page", None)
-        query_string = query_params.urlencode()
+        context["search_query"] = self.search_query
+        # "q" is the only parameter the list carries besides "page".
+        query_string = f"q={quote_plus(self.search_query)}" if self.search_query else ""
         context["query_string"] = query_string
         context["pagination_query"] = f"{query_string}&" if query_string else ""
         return context
 
 
+class PersonSearchView(LoginRequiredMixin, View):
+    """Return persons matching the search query for the bulk selection lists."""
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        query = request.GET.get("q", "").strip()
+        queryset = _search_persons(Person.objects.all(), query)
+        persons = queryset.only(
+            "pk", "last_name", "first_name", "middle_name", "edrpvr_number", "account_category"
+        )[:PERSON_SELECTION_PAGE_SIZE]
+        results = [
+            {
+                "id": person.pk,
+                "label": str(person),
+                "edrpvr_number": person.edrpvr_number,
+                "account_category": person.account_category,
+            }
+            for person in persons
+        ]
+        return JsonResponse({"results": results})
+
+
 class TckReferenceView(LoginRequiredMixin, SidebarContextMixin, TemplateView):
     template_name = "persons/tck_reference.html"
     sidebar_active = "tck_reference"
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        reference_data = get_tck_reference_data()
-        context["tck_regions"] = reference_data
-        context["tck_entries_total"] = count_tck_entries(reference_data)
+        context["tck_regions"] = get_tck_reference_data()
+        context["tck_entries_total"] = get_tck_entries_total()
         return context
 
 
@@ -146,6 +181,10 @@ class PersonDeleteView(LoginRequiredMixin, SidebarContextMixin, DeleteView):
     context_object_name = "person"
     sidebar_active = "list"
 
+    def get_queryset(self):
+        # The confirmation page only renders str(person); deletion needs the pk.
+        return super().get_queryset().only("pk", "last_name", "first_name", "middle_name")
+
     def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         messages.success(request, "Запис успішно видалено")
         return super().delete(request, *args, **kwargs)
@@ -163,12 +202,28 @@ class AccountSettingsView(LoginRequiredMixin, SidebarContextMixin, PasswordChang
 
 RULES_FILE_PATH = Path(settings.BASE_DIR) / "data" / "militaryaccountingrules.md"
 PRIMARY_COLOR = "#ffba00"
+RULES_PDF_CACHE_TIMEOUT = 60 * 60
+# Bump whenever person_rules_pdf.html, PRIMARY_COLOR or the rules markdown
+# rendering changes, so cached PDFs from the previous deploy are not served.
+RULES_PDF_CACHE_VERSION = 1
 MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 BRACED_TEXT_PATTERN = re.compile(r"\{[^{}]*\}")
 
 
-def _load_rules_html() -> str:
-    raw_text = RULES_FILE_PATH.read_text(encoding="utf-8")
+def _load_rules_html() -> SafeString:
+    """Return the rendered rules, re-rendering only when the Markdown file changes."""
+
+    stat = RULES_FILE_PATH.stat()
+    return _render_rules_html(stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _render_rules_html(size: int, mtime_ns: int) -> SafeString:
+    # The arguments only key the cache on the file's current version.
+    return mark_safe(_rules_markdown_to_html(RULES_FILE_PATH.read_text(encoding="utf-8")))
+
+
+def _rules_markdown_to_html(raw_text: str) -> str:
     lines = raw_text.splitlines()
     if not lines:
         return ""
@@ -220,6 +275,7 @@ def _render_body_html(text: str) -> str:
 def _render_links(text: str, *, braced: bool = False) -> str:
     segments: list[str] = []
     last_index = 0
+    class_attr = "rules-link rules-link--braced" if braced else "rules-link"
     for match in MARKDOWN_LINK_PATTERN.finditer(text):
         start, end = match.span()
         if start > last_index:
@@ -227,10 +283,6 @@ def _render_links(text: str, *, braced: bool = False) -> str:
 
         label = escape(match.group(1))
         url = html.escape(match.group(2).strip(), quote=True)
-        classes = ["rules-link"]
-        if braced:
-            classes.append("rules-link--braced")
-        class_attr = " ".join(classes)
         segments.append(
             f'<a class="{class_attr}" href="{url}" target="_blank" rel="noopener noreferrer" data-label="{label}">{label}</a>'
         )
@@ -242,7 +294,9 @@ def _render_links(text: str, *, braced: bool = False) -> str:
     return "".join(segments)
 
 
+@lru_cache(maxsize=1)
 def _get_weasyprint_html() -> Optional[type]:
+    # Cached so a missing WeasyPrint is not searched for again on every request.
     try:
         from weasyprint import HTML as WeasyPrintHTML  # type: ignore
     except Exception:  # pragma: no cover - optional dependency
@@ -250,17 +304,51 @@ def _get_weasyprint_html() -> Optional[type]:
     return WeasyPrintHTML
 
 
-def _build_rules_context(person: Person) -> Dict[str, Any]:
-    acknowledgement_note = "З Правилами військового обліку ознайомлений"
+# The PDF templates load their @font-face files from a CDN; WeasyPrint would
+# download them again for every document.
+PDF_CACHED_RESOURCE_SUFFIXES = (".woff", ".woff2", ".ttf", ".otf")
+_pdf_resource_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _pdf_url_fetcher(url: str) -> Dict[str, Any]:
+    from weasyprint import default_url_fetcher  # type: ignore
+
+    if not url.lower().endswith(PDF_CACHED_RESOURCE_SUFFIXES):
+        return default_url_fetcher(url)
+    cached = _pdf_resource_cache.get(url)
+    if cached is None:
+        fetched = default_url_fetcher(url)
+        file_obj = fetched.pop("file_obj", None)
+        if file_obj is not None:
+            try:
+                fetched["string"] = file_obj.read()
+            finally:
+                file_obj.close()
+        cached = _pdf_resource_cache[url] = fetched
+    return dict(cached)
+
+
+def _render_pdf(html_renderer: type, html: str, request: HttpRequest) -> bytes:
+    return html_renderer(
+        string=html,
+        base_url=request.build_absolute_uri("/"),
+        url_fetcher=_pdf_url_fetcher,
+    ).write_pdf()
+
+
+def _acknowledgement_note(person: Person) -> str:
     if person.gender == "female":
-        acknowledgement_note = "З Правилами військового обліку ознайомлена"
+        return "З Правилами військового обліку ознайомлена"
+    return "З Правилами військового обліку ознайомлений"
+
 
+def _build_rules_context(person: Person) -> Dict[str, Any]:
     return {
         "person": person,
-        "rules_html": mark_safe(_load_rules_html()),
+        "rules_html": _load_rules_html(),
         "acknowledged_on": timezone.localdate(),
         "primary_color": PRIMARY_COLOR,
-        "acknowledgement_note": acknowledgement_note,
+        "acknowledgement_note": _acknowledgement_note(person),
     }
 
 
@@ -268,27 +356,22 @@ def _build_rules_bulk_context(persons: Sequence[Person]) -> Dict[str, Any]:
     persons_list = list(persons)
     acknowledgement_note = "З Правилами військового обліку ознайомлені"
     if len(persons_list) == 1:
-        single_context = _build_rules_context(persons_list[0])
-        acknowledgement_note = single_context["acknowledgement_note"]
+        acknowledgement_note = _acknowledgement_note(persons_list[0])
     acknowledged_on = timezone.localdate()
-    acknowledgement_entries = [
-        {
-            "date": acknowledged_on,
-            "first_name": person.first_name.strip(),
-            "last_name_upper": person.last_name.strip().upper(),
-            "full_name": " ".join(
-                value
-                for value in (
-                    person.first_name.strip(),
-                    person.last_name.strip().upper(),
-                )
-                if value
-            ),
-        }
-        for person in persons_list
-    ]
+    acknowledgement_entries = []
+    for person in persons_list:
+        first_name = person.first_name.strip()
+        last_name_upper = person.last_name.strip().upper()
+        acknowledgement_entries.append(
+            {
+                "date": acknowledged_on,
+                "first_name": first_name,
+                "last_name_upper": last_name_upper,
+                "full_name": f"{first_name} {last_name_upper}".strip(),
+            }
+        )
     return {
-        "rules_html": mark_safe(_load_rules_html()),
+        "rules_html": _load_rules_html(),
         "acknowledged_on": acknowledged_on,
         "acknowledgement_note": acknowledgement_note,
         "acknowledgement_entries": acknowledgement_entries,
@@ -300,29 +383,35 @@ def _build_rules_bulk_context(persons: Sequence[Person]) -> Dict[str, Any]:
 
 
 def _serialize_person_for_recommendations(person: Person) -> Dict[str, Any]:
-    payload = model_to_dict(person, fields=PersonForm.Meta.fields)  # type: ignore[arg-type]
-    return {key: value for key, value in payload.items() if value not in (None, "", [])}
+    # Every form field is a plain column, so attribute reads match model_to_dict.
+    payload: Dict[str, Any] = {}
+    for name in PERSON_FORM_FIELDS:
+        value = getattr(person, name)
+        if value is not None and value != "":
+            payload[name] = value
+    return payload
+
+
+def _build_persons_recommendations(persons: Sequence[Person]) -> List[List[str]]:
+    results = PersonRecommendationEngine.evaluate_many(
+        _serialize_person_for_recommendations(person) for person in persons
+    )
+    return [
+        recommendations or [NO_RECOMMENDATIONS_MESSAGE]
+        for recommendations in results
+    ]
 
 
-def _build_person_recommendations(person: Person) -> List[str]:
-    engine = PersonRecommendationEngine()
-    engine.reset()
-    engine.declare(PersonData(**_serialize_person_for_recommendations(person)))
-    engine.run()
-    recommendations = engine.get_recommendations()
-    if not recommendations:
-        return ["Додаткові рекомендації відсутні на основі введених даних."]
-    return list(recommendations)
+RECOMMENDATION_CATEGORY_LABELS = (
+    ("conscripts", "призовників"),
+    ("liable", "військовозобовʼязаних"),
+    ("reservists", "резервістів"),
+)
 
 
 def _format_recommendation_categories(categories: Iterable[str]) -> List[str]:
-    order = [
-        ("conscripts", "призовників"),
-        ("liable", "військовозобовʼязаних"),
-        ("reservists", "резервістів"),
-    ]
     categories_set = {value for value in categories if value}
-    return [label for key, label in order if key in categories_set]
+    return [label for key, label in RECOMMENDATION_CATEGORY_LABELS if key in categories_set]
 
 
 def _build_recommendations_selection_summary(selected_count: int, categories: Sequence[str]) -> str:
@@ -349,7 +438,8 @@ def _build_recommendations_bulk_context(
 ) -> Dict[str, Any]:
     persons_list = list(persons)
     entries = []
-    for person in persons_list:
+    recommendations_by_person = _build_persons_recommendations(persons_list)
+    for person, recommendations in zip(persons_list, recommendations_by_person):
         name_parts = [
             part.strip()
             for part in (
@@ -365,7 +455,7 @@ def _build_recommendations_bulk_context(
                 "person": person,
                 "full_name": full_name,
                 "edrpvr_number": person.edrpvr_number or "—",
-                "recommendations": _build_person_recommendations(person),
+                "recommendations": recommendations,
             }
         )
     return {
@@ -401,20 +491,6 @@ class PersonRulesBulkView(LoginRequiredMixin, SidebarContextMixin, FormView):
     form_class = RulesAcknowledgementSelectionForm
     sidebar_active = "rules_bulk"
 
-    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-        context["persons_total"] = Person.objects.count()
-        queryset = context["form"].fields["persons"].queryset if "form" in context else Person.objects.all()
-        context["persons_edrpvr"] = {
-            str(person.pk): (person.edrpvr_number or "—")
-            for person in queryset
-        }
-        context["persons_categories"] = {
-            str(person.pk): person.account_category
-            for person in queryset
-        }
-        return context
-
     def form_valid(self, form: RulesAcknowledgementSelectionForm) -> HttpResponse:
         selected_persons = form.get_selected_persons()
         if not selected_persons:
@@ -438,13 +514,29 @@ class PersonRulesPdfView(LoginRequiredMixin, DetailView):
                 status=503,
             )
         self.object = self.get_object()
-        context = _build_rules_context(self.object)
-        context["request"] = request
-        html = render_to_string("persons/person_rules_pdf.html", context)
-        pdf_bytes = html_renderer(
-            string=html,
-            base_url=request.build_absolute_uri("/"),
-        ).write_pdf()
+        # The PDF shows today's date and the person's name and gender, so
+        # a rendered copy is reused for up to RULES_PDF_CACHE_TIMEOUT within
+        # the same day, until the person or the rules file changes.
+        rules_stat = RULES_FILE_PATH.stat()
+        cache_key = "persons:rules-pdf:{}:{}:{}:{}:{}".format(
+            self.object.pk,
+            self.object.updated_at.timestamp(),
+            rules_stat.st_size,
+            rules_stat.st_mtime_ns,
+            timezone.localdate().isoformat(),
+        )
+        pdf_bytes = cache.get(cache_key, version=RULES_PDF_CACHE_VERSION)
+        if pdf_bytes is None:
+            context = _build_rules_context(self.object)
+            context["request"] = request
+            html = render_to_string("persons/person_rules_pdf.html", context)
+            pdf_bytes = _render_pdf(html_renderer, html, request)
+            cache.set(
+                cache_key,
+                pdf_bytes,
+                RULES_PDF_CACHE_TIMEOUT,
+                version=RULES_PDF_CACHE_VERSION,
+            )
         filename = slugify(f"pravila-{self.object.last_name}-{self.object.first_name}") or "pravila"
         response = HttpResponse(pdf_bytes, content_type="application/pdf")
         response["Content-Disposition"] = f'attachment; filename="{filename}.pdf"'
@@ -459,13 +551,17 @@ class PersonRulesBulkPdfView(LoginRequiredMixin, View):
             return HttpResponseRedirect(reverse("persons:person_rules_bulk"))
 
         try:
-            numeric_ids = [int(pk) for pk in person_ids]
+            numeric_ids = {int(pk) for pk in person_ids}
         except ValueError:
             messages.error(request, "Передані некоректні ідентифікатори записів.")
             return HttpResponseRedirect(reverse("persons:person_rules_bulk"))
 
-        ordering = Person._meta.ordering or ["last_name", "first_name", "middle_name"]
-        persons = list(Person.objects.filter(pk__in=numeric_ids).order_by(*ordering))
+        # The acknowledgement rows use the names; gender picks the single-person note.
+        persons = list(
+            Person.objects.filter(pk__in=numeric_ids)
+            .only("pk", "first_name", "last_name", "gender")
+            .order_by(*PERSON_ORDERING)
+        )
         if not persons:
             messages.error(request, "За вибраними умовами осіб не знайдено.")
             return HttpResponseRedirect(reverse("persons:person_rules_bulk"))
@@ -480,10 +576,7 @@ class PersonRulesBulkPdfView(LoginRequiredMixin, View):
         context = _build_rules_bulk_context(persons)
         context["request"] = request
         html = render_to_string("persons/person_rules_bulk_pdf.html", context)
-        pdf_bytes = html_renderer(
-            string=html,
-            base_url=request.build_absolute_uri("/"),
-        ).write_pdf()
+        pdf_bytes = _render_pdf(html_renderer, html, request)
         filename = slugify("pravila-bagatoh-osib") or "pravila"
         response = HttpResponse(pdf_bytes, content_type="application/pdf")
         response["Content-Disposition"] = f'attachment; filename="{filename}.pdf"'
@@ -495,20 +588,6 @@ class PersonRecommendationsBulkView(LoginRequiredMixin, SidebarContextMixin, For
     form_class = RulesAcknowledgementSelectionForm
     sidebar_active = "recommendations"
 
-    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-        context["persons_total"] = Person.objects.count()
-        queryset = context["form"].fields["persons"].queryset if "form" in context else Person.objects.all()
-        context["persons_edrpvr"] = {
-            str(person.pk): (person.edrpvr_number or "—")
-            for person in queryset
-        }
-        context["persons_categories"] = {
-            str(person.pk): person.account_category
-            for person in queryset
-        }
-        return context
-
     def form_valid(self, form: RulesAcknowledgementSelectionForm) -> HttpResponse:
         selected_persons = form.get_selected_persons()
         if not selected_persons:
@@ -538,13 +617,16 @@ class PersonRecommendationsBulkPdfView(LoginRequiredMixin, View):
             return HttpResponseRedirect(reverse("persons:person_recommendations_bulk"))
 
         try:
-            numeric_ids = [int(pk) for pk in person_ids]
+            numeric_ids = {int(pk) for pk in person_ids}
         except ValueError:
             messages.error(request, "Передані некоректні ідентифікатори записів.")
             return HttpResponseRedirect(reverse("persons:person_recommendations_bulk"))
 
-        ordering = Person._meta.ordering or ["last_name", "first_name", "middle_name"]
-        persons = list(Person.objects.filter(pk__in=numeric_ids).order_by(*ordering))
+        persons = list(
+            Person.objects.filter(pk__in=numeric_ids)
+            .only("pk", *PERSON_FORM_FIELDS)
+            .order_by(*PERSON_ORDERING)
+        )
         if not persons:
             messages.error(request, "За вибраними умовами осіб не знайдено.")
             return HttpResponseRedirect(reverse("persons:person_recommendations_bulk"))
@@ -568,10 +650,7 @@ class PersonRecommendationsBulkPdfView(LoginRequiredMixin, View):
         )
         context["request"] = request
         html = render_to_string("persons/person_recommendations_bulk_pdf.html", context)
-        pdf_bytes = html_renderer(
-            string=html,
-            base_url=request.build_absolute_uri("/"),
-        ).write_pdf()
+        pdf_bytes = _render_pdf(html_renderer, html, request)
         filename = slugify("rekomendatsii-bagatoh-osib") or "rekomendatsii"
         response = HttpResponse(pdf_bytes, content_type="application/pdf")
         response["Content-Disposition"] = f'attachment; filename="{filename}.pdf"'
@@ -0,0 +1,105 @@
+(function () {
+  "use strict";
+
+  const SEARCH_DELAY_MS = 250;
+
+  function normalise(value) {
+    return value.trim().toLocaleLowerCase("uk-UA");
+  }
+
+  function buildRow(template, person, haystackAttr) {
+    const fragment = template.content.cloneNode(true);
+    const row = fragment.firstElementChild;
+    if (!row) {
+      return null;
+    }
+    const personId = String(person.id);
+    const checkboxId = `id_persons_search_${personId}`;
+    const edrpvr = person.edrpvr_number || "";
+    row.setAttribute("data-person-id", personId);
+    row.setAttribute("data-person-category", person.account_category || "");
+    row.setAttribute("data-person-edrpvr", edrpvr);
+    row.setAttribute(haystackAttr, normalise(`${person.label} ${edrpvr}`));
+
+    const checkbox = row.querySelector('input[type="checkbox"]');
+    if (checkbox) {
+      checkbox.id = checkboxId;
+      checkbox.value = personId;
+    }
+    row.querySelectorAll("[data-person-field='label']").forEach((element) => {
+      element.textContent = person.label;
+      if (element.tagName === "LABEL") {
+        element.setAttribute("for", checkboxId);
+      }
+    });
+    row.querySelectorAll("[data-person-field='edrpvr']").forEach((element) => {
+      element.textContent = edrpvr || "—";
+    });
+    row.querySelectorAll("[data-checkbox-id]").forEach((element) => {
+      element.setAttribute("data-checkbox-id", checkboxId);
+    });
+    return row;
+  }
+
+  function initList(list) {
+    const url = list.getAttribute("data-person-search-url");
+    const inputSelector = list.getAttribute("data-person-search-input");
+    const haystackAttr = list.getAttribute("data-person-search-haystack");
+    const template = list.querySelector("template[data-person-row-template]");
+    const input = inputSelector ? document.querySelector(inputSelector) : null;
+    if (!url || !input || !haystackAttr || !template) {
+      return;
+    }
+
+    let timer = null;
+    let controller = null;
+
+    const search = (term) => {
+      if (controller) {
+        controller.abort();
+      }
+      controller = new AbortController();
+      fetch(`${url}?q=${encodeURIComponent(term)}`, {
+        credentials: "same-origin",
+        headers: { Accept: "application/json" },
+        signal: controller.signal,
+      })
+        .then((response) => (response.ok ? response.json() : { results: [] }))
+        .then((data) => {
+          const matchKey = normalise(term);
+          const addedRows = [];
+          (data.results || []).forEach((person) => {
+            let row = list.querySelector(`[data-person-id="${person.id}"]`);
+            if (!row) {
+              row = buildRow(template, person, haystackAttr);
+              if (!row) {
+                return;
+              }
+              list.insertBefore(row, template);
+              addedRows.push(row);
+            }
+            row.setAttribute("data-person-search-match", matchKey);
+          });
+          list.dispatchEvent(
+            new CustomEvent("persons:rows-added", { detail: { rows: addedRows, term: matchKey } })
+          );
+        })
+        .catch((error) => {
+          if (error.name !== "AbortError") {
+            console.error(error);
+          }
+        });
+    };
+
+    input.addEventListener("input", () => {
+      window.clearTimeout(timer);
+      const term = input.value.trim();
+      if (!term) {
+        return;
+      }
+      timer = window.setTimeout(() => search(term), SEARCH_DELAY_MS);
+    });
+  }
+
+  document.querySelectorAll("[data-person-search-url]").forEach(initList);
+})();
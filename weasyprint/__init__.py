@@ -7,15 +7,15 @@ import importlib.util
 import sys
 from pathlib import Path
 from types import ModuleType
-from typing import Iterable, List
+from typing import Iterable, Iterator
 
 from accountingplus.weasyprint_support import bootstrap
 
 
-def _collect_search_paths(current_package_dir: Path) -> List[str]:
+def _collect_search_paths(current_package_dir: Path) -> Iterator[str]:
+    # Lazy, so sys.path entries after the real package are never resolved.
     project_root = current_package_dir.parent.resolve()
-    search_paths: List[str] = []
-    for entry in sys.path:
+    for entry in list(sys.path):
         try:
             resolved = Path(entry or ".").resolve()
         except OSError:
@@ -23,12 +23,12 @@ def _collect_search_paths(current_package_dir: Path) -> List[str]:
             continue
         if resolved == project_root:
             continue
-        search_paths.append(str(resolved))
-    return search_paths
+        yield str(resolved)
 
 
 def _load_original_weasyprint(search_paths: Iterable[str]) -> tuple[ModuleType, str]:
     module_name = __name__
+    shim_dir = Path(__file__).resolve().parent
     for entry in search_paths:
         try:
             spec = importlib.machinery.PathFinder.find_spec(module_name, [entry])
@@ -41,7 +41,7 @@ def _load_original_weasyprint(search_paths: Iterable[str]) -> tuple[ModuleType,
         if origin is None:
             continue
         package_dir = Path(origin).resolve().parent
-        if package_dir == Path(__file__).resolve().parent:
+        if package_dir == shim_dir:
             # Skip our shim package.
             continue
         real_name = f"_{module_name}_real"
@@ -59,24 +59,29 @@ def _load_original_weasyprint(search_paths: Iterable[str]) -> tuple[ModuleType,
     raise ImportError("Failed to locate the original WeasyPrint package.")
 
 
+_PRESERVED_SHIM_KEYS = frozenset(
+    {"__name__", "__package__", "__loader__", "__spec__", "__path__", "__file__"}
+)
+
+
 def _apply_real_module(real: ModuleType, alias_name: str) -> None:
     shim = sys.modules[__name__]
     shim_dict = shim.__dict__
     real_dict = real.__dict__
 
     # Remove previously injected symbols except the mandatory module metadata.
-    for key in list(shim_dict.keys()):
-        if key in {"__name__", "__package__", "__loader__", "__spec__", "__path__", "__file__"}:
-            continue
-        if key.startswith("_accountingplus"):
-            continue
-        shim_dict.pop(key, None)
-
-    # Copy the real module content into the shim.
-    for key, value in real_dict.items():
-        if key == "__name__":
-            continue
-        shim_dict[key] = value
+    kept = {
+        key: value
+        for key, value in shim_dict.items()
+        if key in _PRESERVED_SHIM_KEYS or key.startswith("_accountingplus")
+    }
+    shim_dict.clear()
+    shim_dict.update(kept)
+
+    # Copy the real module content into the shim, keeping the shim's name.
+    shim_name = shim_dict["__name__"]
+    shim_dict.update(real_dict)
+    shim_dict["__name__"] = shim_name
 
     # Ensure module metadata points to the real implementation.
     for meta in ("__doc__", "__all__", "__package__", "__file__", "__path__", "__loader__", "__spec__"):